@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Micro-benchmarks for the parts of the automation that do not need a browser."""
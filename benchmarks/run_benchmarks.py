@@ -0,0 +1,193 @@
+# benchmarks/run_benchmarks.py
+'''Micro-benchmarks for the ingestion and error-reporting paths (no browser needed).
+
+Run from the project folder:
+    python -m benchmarks.run_benchmarks                   compare against benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --update-baseline record new baseline timings
+    python -m benchmarks.run_benchmarks --sizes 1000      only the 1k-row inputs
+
+Exits with status 1 when a benchmark is slower than its baseline by more than --tolerance
+and by more than --min-delta-ms, or when there is no baseline and --update-baseline is not given.
+'''
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+import excel_to_dataframe
+from helpers.transfer import log_error, log_item_error, new_errors_df, save_errors
+from helpers.plan import compile_plan
+from benchmarks.synthetic import write_order_files
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+def best_of(func, repeats):
+    """
+    Runs func `repeats` times and returns the fastest wall-clock time in seconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def bench_ingestion(directory, rows, repeats):
+    """
+    Times each stage of excel_to_dataframe on synthetic files with `rows` order lines.
+    Returns:
+        dict: Stage name to seconds.
+    """
+    quantity_path, product_path = write_order_files(directory, rows)
+    results = {}
+    frames = {}
+
+    def load():
+        frames['raw'] = excel_to_dataframe.load_frames(quantity_path, product_path)
+    results[f'ingest.load[{rows}]'] = best_of(load, repeats)
+
+    def clean():
+        quantity_df, product_df = frames['raw']
+        frames['clean'] = excel_to_dataframe.clean_frames(quantity_df.copy(), product_df.copy())
+    results[f'ingest.clean[{rows}]'] = best_of(clean, repeats)
+
+    def merge():
+        frames['merged'], _ = excel_to_dataframe.merge_frames(*frames['clean'])
+    results[f'ingest.merge[{rows}]'] = best_of(merge, repeats)
+
+    def dedupe():
+        frames['unique'], _ = excel_to_dataframe.split_duplicates(frames['merged'])
+    results[f'ingest.dedupe[{rows}]'] = best_of(dedupe, repeats)
+
+    def compact():
+        excel_to_dataframe.compact_dtypes(frames['unique'])
+    results[f'ingest.compact[{rows}]'] = best_of(compact, repeats)
+    return results
+
+def bench_log_error(directory, errors, repeats):
+    """
+    Times recording `errors` errors with helpers.transfer.log_error.
+    """
+    quantity_path, product_path = write_order_files(directory, errors)
+    input_df = excel_to_dataframe.load_input(quantity_path, product_path)
+    row_count = len(input_df)
+
+    def record():
+        errors_df = new_errors_df()
+        for i in range(errors):
+            log_error(errors_df, row_index=i % row_count, input_file=input_df,
+                      error_type="Total Cost Mismatch", error_message="Benchmark error",
+                      error_details={'Web_Difference': 0.01})
+    return {f'transfer.log_error[{errors}]': best_of(record, repeats)}
+
+def bench_plan(directory, rows, repeats):
+    """
+    Times compiling the work plan for `rows` rows, and recording errors from plan items.
+    """
+    quantity_path, product_path = write_order_files(directory, rows)
+    input_df = excel_to_dataframe.load_input(quantity_path, product_path)
+    results = {f'plan.compile[{rows}]': best_of(lambda: compile_plan(input_df), repeats)}
+    plan = compile_plan(input_df)
+
+    def record():
+        errors = []
+        for i in range(rows):
+            log_item_error(errors, plan[i % len(plan)], error_type="Total Cost Mismatch",
+                           error_message="Benchmark error", error_details={'Web_Difference': 0.01})
+    results[f'transfer.log_item_error[{rows}]'] = best_of(record, repeats)
+    return results
+
+def bench_save_errors(directory, batches, errors_per_batch, repeats):
+    """
+    Times appending `batches` batches of errors with helpers.transfer.save_errors.
+    """
+    quantity_path, product_path = write_order_files(directory, errors_per_batch)
+    input_df = excel_to_dataframe.load_input(quantity_path, product_path)
+    errors_df = new_errors_df()
+    for i in range(errors_per_batch):
+        log_error(errors_df, row_index=i % len(input_df), input_file=input_df,
+                  error_type="Processing Error", error_message="Benchmark error")
+    journal_path = os.path.join(directory, 'errors_journal.csv')
+
+    def save():
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        for batch_num in range(batches):
+            save_errors(errors_df, journal_path, batch_num)
+    return {f'transfer.save_errors[{batches}x{errors_per_batch}]': best_of(save, repeats)}
+
+def compare(results, baseline, tolerance, min_delta=0.0):
+    """
+    Returns the benchmarks that are slower than baseline * tolerance and by more than
+    min_delta seconds, so timer noise on the fastest benchmarks is not reported.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is not None and seconds > previous * tolerance and seconds - previous > min_delta:
+            regressions.append((name, previous, seconds))
+    return regressions
+
+def main(argv=None):
+    """Runs the benchmarks, prints the timings and checks them against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Order line counts for the ingestion benchmarks.")
+    parser.add_argument('--repeats', type=int, default=3, help="Runs per benchmark; the fastest counts.")
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help="Allowed slowdown factor before a benchmark fails.")
+    parser.add_argument('--min-delta-ms', type=float, default=5.0,
+                        help="Slowdowns smaller than this many milliseconds are never a regression.")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON file.")
+    parser.add_argument('--update-baseline', action='store_true', help="Write the timings as the new baseline.")
+    parser.add_argument('--output', help="Also write this run's timings to a JSON file.")
+    args = parser.parse_args(argv)
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 1
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.sizes:
+            # The 1M-row inputs take long enough that a single run is representative
+            results.update(bench_ingestion(directory, rows, 1 if rows >= 1_000_000 else args.repeats))
+        results.update(bench_log_error(directory, 10_000, 1))
+        results.update(bench_plan(directory, 10_000, args.repeats))
+        results.update(bench_save_errors(directory, 120, 20, args.repeats))
+
+    for name, seconds in results.items():
+        print(f"{name:<45} {seconds * 1000:>12.1f} ms")
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'machine': platform.node(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+    if regressions:
+        print(f"\nREGRESSION: {len(regressions)} benchmarks are more than {args.tolerance}x "
+              f"and {args.min_delta_ms:g} ms slower than the baseline from {baseline.get('created')}:")
+        for name, previous, seconds in regressions:
+            print(f"  {name}: {previous * 1000:.1f} ms -> {seconds * 1000:.1f} ms")
+        return 1
+    print(f"\nAll benchmarks within {args.tolerance}x of the baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
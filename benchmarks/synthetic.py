@@ -0,0 +1,86 @@
+# benchmarks/synthetic.py
+'''Generators for synthetic input files shaped like the supplier exports in Input_Files/.'''
+import os
+import numpy as np
+import pandas as pd
+
+# Header lines as exported by Synergy; the blank columns become 'Unnamed: N' when read
+QUANTITY_HEADER = ',Description,Unit,Qty,,Cost per Unit,,,,Total,\n'
+PRODUCT_HEADER = ',"Order Qty\n(Pack / Case)",Code,,Description,,Order Size,,,Price,\n'
+
+UNITS = ['6 x Single Item', '8 x Single Item', '12 x Single Item', '24 x Single Item', 'Case 20']
+
+def _descriptions(rng, count):
+    """Returns `count` distinct product descriptions with irregular spacing, like the exports."""
+    sizes = rng.choice(['330Ml', '500Ml', '700ml', '750Ml', '2L'], size=count)
+    spacing = rng.choice([' ', '  '], size=count)
+    return [f"Product {i}{space}{size} {i % 40}%" for i, (size, space) in enumerate(zip(sizes, spacing))]
+
+def _write_csv(df, header, path):
+    """Writes the export's own header line followed by the rows."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(header)
+        df.to_csv(f, index=False, header=False, lineterminator='\n')
+
+def write_order_files(directory, rows, seed=0):
+    """
+    Writes a quantity (order) CSV and a product (catalog) CSV with `rows` order lines.
+    The order repeats about 2% of its products and references about 1% missing products,
+    and about 2% of catalog codes are non-numeric, as in the real exports.
+    Args:
+        directory (str): Output directory.
+        rows (int): Number of order lines.
+        seed (int): Random seed so the same files are generated every time.
+    Returns:
+        tuple: (quantity_path, product_path)
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    catalog_size = rows + rows // 10
+    descriptions = np.array(_descriptions(rng, catalog_size))
+    prices = rng.integers(100, 100000, size=catalog_size) / 100
+    codes = rng.permutation(catalog_size) + 10000
+
+    product_df = pd.DataFrame({
+        'blank_0': '',
+        'order_qty': '',
+        'Code': codes.astype(str),
+        'blank_3': '',
+        'Description': descriptions,
+        'blank_5': '',
+        'Order Size': rng.choice(UNITS, size=catalog_size),
+        'blank_7': '',
+        'blank_8': '',
+        'Price': [f"¤ {price:,.2f}" for price in prices],
+        'blank_10': '',
+    })
+    # Non-numeric codes and repeated headers are filtered out during cleaning
+    junk = rng.choice(catalog_size, size=max(1, catalog_size // 50), replace=False)
+    product_df.loc[junk, 'Code'] = 'CRATE' + product_df.loc[junk, 'Code']
+    product_path = os.path.join(directory, f"product_list_{rows}.csv")
+    _write_csv(product_df, PRODUCT_HEADER, product_path)
+
+    picks = rng.choice(catalog_size, size=rows, replace=False)
+    repeats = rng.choice(rows, size=max(1, rows // 50), replace=False)
+    picks[repeats] = picks[rng.choice(rows, size=len(repeats))]
+    order_descriptions = descriptions[picks].astype(object)
+    missing = rng.choice(rows, size=max(1, rows // 100), replace=False)
+    order_descriptions[missing] = [f"Discontinued {i}" for i in missing]
+    qty = rng.integers(1, 20, size=rows)
+    cost = prices[picks]
+    quantity_df = pd.DataFrame({
+        'blank_0': '',
+        'Description': order_descriptions,
+        'Unit': rng.choice(UNITS, size=rows),
+        'Qty': qty,
+        'blank_4': '',
+        'Cost per Unit': [f"¤ {value:,.2f}" for value in cost],
+        'blank_6': '',
+        'blank_7': '',
+        'blank_8': '',
+        'Total': [f"¤ {value:,.2f}" for value in qty * cost],
+        'blank_10': '',
+    })
+    quantity_path = os.path.join(directory, f"quantity_timeframe_{rows}.csv")
+    _write_csv(quantity_df, QUANTITY_HEADER, quantity_path)
+    return quantity_path, product_path
@@ -0,0 +1,230 @@
+# Code/cli.py
+'''Command line entry point for the carryout automation.
+
+Commands:
+    run       Start a new run from the first batch (or only changed rows with --incremental).
+    resume    Continue a run from the last checkpoint.
+    validate  Ingest and pre-check the input files without opening the browser.
+    report    Rebuild the output workbook from the error journal and run summary.
+    sync-catalog  Download the supplier catalog into a local snapshot for offline checks.
+    ingest    Prepare every order export in a directory as a work item, in parallel.
+
+Heavy modules (pandas, selenium, xlsxwriter) are imported inside the commands that need them.
+'''
+import time
+_STARTED = time.perf_counter()
+import argparse
+import logging
+import os
+import sys
+import config
+from logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+def input_source(args):
+    """Describes the input given on the command line, as recorded in the run summary."""
+    if args.work_item:
+        return {'work_item': os.path.abspath(args.work_item)}
+    return {'quantity': os.path.abspath(args.quantity or config.INPUT_QUANTITY_PATH),
+            'products': os.path.abspath(args.products or config.INPUT_TIME_PATH)}
+
+def load_source(source):
+    """Loads the rows of an input_source: a work item, or the order and catalog files."""
+    if source.get('work_item'):
+        from excel_to_dataframe import load_work_item
+        return load_work_item(source['work_item'])
+    from excel_to_dataframe import load_input
+    return load_input(source.get('quantity'), source.get('products'))
+
+def run_input_source(args, summary):
+    """
+    Returns the input given on the command line, or without input options the input the
+    last run was given, so its error indexes line up with the rows loaded again.
+    """
+    if args.work_item or args.quantity or args.products or not summary.get('input'):
+        return input_source(args)
+    print(f"Using the input of the last run: {', '.join(summary['input'].values())}")
+    return summary['input']
+
+def load_rows(args):
+    """Loads the rows to enter from --work-item, or by ingesting --quantity and --products."""
+    return load_source(input_source(args))
+
+def finish_run(completed, incremental=False):
+    """Removes the checkpoint after a completed run; otherwise keeps it so the run can be resumed."""
+    if not completed and incremental:
+        print("The run did not complete. Continue with 'resume'; it enters the rows that are still "
+              "added or changed, skipping the ones already entered.")
+        return 1
+    if not completed:
+        print(f"The run did not complete; the checkpoint was kept at {config.CHECKPOINT_PATH}. "
+              "Continue with 'resume'.")
+        return 1
+    if os.path.exists(config.CHECKPOINT_PATH):
+        os.remove(config.CHECKPOINT_PATH)
+    return 0
+
+def run(args):
+    """Starts a new run from the first batch."""
+    from simplified import main
+    completed = main(load_rows(args), reset_checkpoint=True, input_source=input_source(args),
+                     incremental=args.incremental, prune_removed=args.prune_removed,
+                     catalog_check=not args.skip_catalog_check, status_port=args.status_port,
+                     retry_passes=args.retry_passes, http_lookup=args.http_lookup)
+    return finish_run(completed, args.incremental)
+
+def resume(args):
+    """Continues a run from the last checkpoint."""
+    from simplified import main
+    from helpers import load_run_summary
+    summary = load_run_summary(config.RUN_SUMMARY_PATH)
+    # An incremental run has no batch checkpoint; diffing again skips the rows it entered
+    incremental = summary.get('incremental', False)
+    if incremental:
+        print("The last run was incremental. Entering the rows that are still added or changed.")
+    elif not os.path.exists(config.CHECKPOINT_PATH):
+        print("No checkpoint found. Starting from the first batch.")
+    # The checkpoint counts batches of the input the run was started with
+    source = run_input_source(args, summary)
+    completed = main(load_source(source), incremental=incremental, input_source=source,
+                     catalog_check=not args.skip_catalog_check,
+                     status_port=args.status_port, retry_passes=args.retry_passes,
+                     http_lookup=args.http_lookup)
+    return finish_run(completed, incremental)
+
+def validate(args):
+    """Ingests the input files and reports rows that would fail on the web form."""
+    from excel_to_dataframe import load_input, validate_input
+    unique_df, duplicates_df, unmatched_df = load_input(args.quantity, args.products, with_details=True)
+    issues_df = validate_input(unique_df, duplicates_df, unmatched_df)
+    if os.path.exists(config.CATALOG_SNAPSHOT_PATH):
+        import pandas as pd
+        from helpers import check_against_catalog, snapshot_synced_at
+        unknown_df = check_against_catalog(unique_df, config.CATALOG_SNAPSHOT_PATH)
+        print(f"Checked against the catalog snapshot taken {snapshot_synced_at(config.CATALOG_SNAPSHOT_PATH)}.")
+        if not unknown_df.empty:
+            unknown_df = unknown_df.rename(columns={'Reason': 'Issue'}).rename_axis('Index').reset_index()
+            issues_df = pd.concat([issues_df, unknown_df[issues_df.columns]], ignore_index=True)
+    else:
+        print("No catalog snapshot found; run 'sync-catalog' to check codes offline.")
+    print(f"{len(unique_df)} rows ready to enter, {len(issues_df)} issues found.")
+    if not issues_df.empty:
+        print(issues_df.to_string(index=False))
+        if args.output:
+            issues_df.to_csv(args.output, index=False)
+            print(f"Issues saved to {args.output}")
+    return 1 if not issues_df.empty else 0
+
+def report(args):
+    """Rebuilds the output workbook from the error journal and the saved run summary."""
+    from helpers import load_run_summary, removed_rows, write_report
+    summary = load_run_summary(config.RUN_SUMMARY_PATH)
+    written = write_report(config.OUTPUT_XLSX_PATH, load_source(run_input_source(args, summary)),
+                           config.ERRORS_JOURNAL_PATH, summary,
+                           removed_df=removed_rows(summary['removed_codes']))
+    return 0 if written else 1
+
+def sync_catalog(args):
+    """Pages through the supplier catalog in the search modal and stores a local snapshot."""
+    from selenium.common.exceptions import TimeoutException
+    from helpers import (initialize_driver, start_session, search_product, extract_catalog_pages,
+                         close_form, close_driver, save_catalog_snapshot)
+    driver = initialize_driver()
+    try:
+        start_session(driver)
+        # An empty search lists the supplier's whole catalog
+        search_product(driver, "")
+        catalog = extract_catalog_pages(driver, timeout=args.page_timeout)
+        close_form(driver)
+    except TimeoutException as e:
+        # A partial catalog would flag every product on the missing pages as unknown
+        print(f"{e.msg} The previous snapshot was kept.")
+        return 1
+    finally:
+        close_driver(driver)
+    if not catalog:
+        print("No catalog rows were found; the previous snapshot was kept.")
+        return 1
+    count = save_catalog_snapshot(catalog, config.CATALOG_SNAPSHOT_PATH)
+    print(f"Catalog snapshot with {count} products saved to {config.CATALOG_SNAPSHOT_PATH}")
+    return 0
+
+def ingest(args):
+    """Prepares every order export in a directory as a ready-to-run work item."""
+    from excel_to_dataframe import ingest_directory
+    summary_df = ingest_directory(args.directory, args.output_dir, args.workers)
+    if summary_df.empty:
+        print(f"No order and catalog exports found in {args.directory}.")
+        return 1
+    print(summary_df.drop(columns=['Work Item', 'Report'], errors='ignore').to_string(index=False))
+    print(f"Work items and ingest reports saved to {args.output_dir or config.WORK_ITEMS_DIR}")
+    return 1 if summary_df['Error'].astype(bool).any() else 0
+
+def build_parser():
+    """Builds the argument parser with one subcommand per workflow."""
+    parser = argparse.ArgumentParser(description="Carryout automation for the Synergy web form.")
+    parser.add_argument('--timings', action='store_true',
+                        help="Print start-up and command durations.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, func, help_text in (
+            ('run', run, "Start a new run from the first batch."),
+            ('resume', resume, "Continue a run from the last checkpoint."),
+            ('validate', validate, "Ingest and pre-check the input files without the browser."),
+            ('report', report, "Rebuild the output workbook.")):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.set_defaults(func=func)
+        subparser.add_argument('--quantity', help="Order file. Defaults to INPUT_QUANTITY_PATH.")
+        subparser.add_argument('--products', help="Catalog file. Defaults to INPUT_TIME_PATH.")
+
+    run_parser = subparsers.choices['run']
+    run_parser.add_argument('--incremental', action='store_true',
+                            help="Only enter rows added or changed since the previous submission.")
+    run_parser.add_argument('--prune-removed', action='store_true',
+                            help="Forget previously submitted lines that are no longer in the input.")
+    subparsers.choices['report'].add_argument(
+        '--work-item', help="Build the Input Data sheet from this work item. Defaults to the input of the last run.")
+    for name in ('run', 'resume'):
+        subparsers.choices[name].add_argument(
+            '--work-item', help="Enter the rows of a work item from 'ingest' instead of the input files.")
+        subparsers.choices[name].add_argument(
+            '--skip-catalog-check', action='store_true',
+            help="Do not skip rows that are missing from the catalog snapshot.")
+        subparsers.choices[name].add_argument(
+            '--status-port', type=int, default=config.STATUS_PORT,
+            help="Serve live progress as JSON on this local port (0 disables).")
+        subparsers.choices[name].add_argument(
+            '--retry-passes', type=int, default=config.RETRY_PASSES,
+            help="Retry rows that hit a processing error this many times after the main pass (0 disables).")
+        subparsers.choices[name].add_argument(
+            '--http-lookup', action=argparse.BooleanOptionalAction, default=config.HTTP_LOOKUP,
+            help="Search products over HTTP with the browser's session instead of in the search modal.")
+    subparsers.choices['validate'].add_argument('--output', help="Save the issues to a CSV file.")
+    sync_parser = subparsers.add_parser('sync-catalog', help="Download the supplier catalog snapshot.")
+    sync_parser.set_defaults(func=sync_catalog)
+    sync_parser.add_argument('--page-timeout', type=int, default=30,
+                             help="Seconds to wait for each catalog page.")
+    ingest_parser = subparsers.add_parser('ingest', help="Prepare a directory of order exports in parallel.")
+    ingest_parser.set_defaults(func=ingest)
+    ingest_parser.add_argument('directory', help="Directory with quantity_timeframe* and product_list* exports.")
+    ingest_parser.add_argument('--output-dir', help="Where to write the work items. Defaults to WORK_ITEMS_DIR.")
+    ingest_parser.add_argument('--workers', type=int, help="Worker processes. Defaults to one per CPU.")
+    return parser
+
+def main(argv=None):
+    """Parses the command line and dispatches to the chosen command."""
+    args = build_parser().parse_args(argv)
+    setup_logging()
+    startup_ms = (time.perf_counter() - _STARTED) * 1000
+    logger.debug("Start-up took %.0f ms.", startup_ms)
+    command_started = time.perf_counter()
+    exit_code = args.func(args)
+    if args.timings:
+        print(f"Start-up: {startup_ms:.0f} ms, {args.command}: "
+              f"{(time.perf_counter() - command_started) * 1000:.0f} ms, "
+              f"selenium imported: {'selenium' in sys.modules}")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
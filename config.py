@@ -36,12 +36,57 @@ INPUT_QUANTITY_PATH = os.path.join(BASE_DIR, config.get('input_paths', 'INPUT_QU
 INPUT_TIME_PATH = os.path.join(BASE_DIR, config.get('input_paths', 'INPUT_TIME_PATH'))
 DOCKET_CSV_PATH = os.path.join(BASE_DIR, config.get('input_paths', 'DOCKET_CSV_PATH'))
 DOCKET_PICKLE_PATH = os.path.join(BASE_DIR, config.get('input_paths', 'DOCKET_PICKLE_PATH'))
+INPUT_CACHE_DIR = os.path.join(BASE_DIR, config.get('input_paths', 'INPUT_CACHE_DIR',
+                                                    fallback='Checkpoint/cache'))
 
 # Output paths
 OUTPUT_CSV_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'OUTPUT_CSV_PATH'))
 OUTPUT_XLSX_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'OUTPUT_XLSX_PATH'))
 CHECKPOINT_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'CHECKPOINT_PATH'))
 ERRORS_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'ERRORS_PATH'))
+SUBMITTED_ROWS_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'SUBMITTED_ROWS_PATH',
+                                                        fallback='Checkpoint/submitted_rows.json'))
+ERRORS_JOURNAL_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'ERRORS_JOURNAL_PATH',
+                                                        fallback='Checkpoint/errors_journal.csv'))
+RUN_SUMMARY_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'RUN_SUMMARY_PATH',
+                                                     fallback='Checkpoint/run_summary.json'))
+CATALOG_SNAPSHOT_PATH = os.path.join(BASE_DIR, config.get('output_paths', 'CATALOG_SNAPSHOT_PATH',
+                                                          fallback='Checkpoint/catalog.sqlite'))
+WORK_ITEMS_DIR = os.path.join(BASE_DIR, config.get('output_paths', 'WORK_ITEMS_DIR',
+                                                   fallback='Checkpoint/work_items'))
+
+# Live status: JSON on http://localhost:<status_port>/ during a run, 0 to disable
+STATUS_PORT = config.getint('status', 'status_port', fallback=0)
+
+# Browser watchdog: recycle the driver every N rows, when row latency grows by a factor,
+# or when the browser uses more memory than the limit. 0 disables each check; all are off by default
+# because recycling saves the open form and starts a new carryout.
+RECYCLE_EVERY_ROWS = config.getint('watchdog', 'recycle_every_rows', fallback=0)
+RECYCLE_LATENCY_FACTOR = config.getfloat('watchdog', 'latency_factor', fallback=0.0)
+RECYCLE_RSS_LIMIT_MB = config.getint('watchdog', 'rss_limit_mb', fallback=0)
+WATCHDOG_WINDOW = config.getint('watchdog', 'window', fallback=50)
+
+# Retry passes: rows that fail with a processing error before their line was filled in are retried
+# after the main pass, on the open form, or on a fresh browser session (and so a new carryout)
+# when retry_fresh_driver is set. 0 reports them straight away.
+RETRY_PASSES = config.getint('retry', 'retry_passes', fallback=1)
+RETRY_FRESH_DRIVER = config.getboolean('retry', 'retry_fresh_driver', fallback=False)
+
+# Network capture: read product search results from the backend JSON responses instead of
+# the rendered table. The URL pattern is a regular expression; fields are dotted JSON paths.
+NETWORK_CAPTURE = config.getboolean('network_capture', 'enabled', fallback=False)
+SEARCH_URL_PATTERN = config.get('network_capture', 'search_url_pattern', fallback=r'[Pp]roduct.*[Ss]earch')
+SEARCH_RESULTS_FIELD = config.get('network_capture', 'results_field', fallback='data')
+SEARCH_CODE_FIELD = config.get('network_capture', 'code_field', fallback='productCode')
+SEARCH_DESCRIPTION_FIELD = config.get('network_capture', 'description_field', fallback='description')
+
+# HTTP lookup: search products straight against the backend with the browser's session cookies.
+# search_url needs a {code} placeholder; the response is read with the network_capture fields.
+HTTP_LOOKUP = config.getboolean('http_lookup', 'enabled', fallback=False)
+HTTP_SEARCH_URL = config.get('http_lookup', 'search_url', raw=True, fallback='')
+HTTP_LOOKUP_WORKERS = config.getint('http_lookup', 'workers', fallback=8)
+HTTP_LOOKUP_TIMEOUT = config.getfloat('http_lookup', 'timeout', fallback=10.0)
+
 
 # Logging configurations
 LOG_FILE = os.path.join(BASE_DIR, config.get('logging', 'log_file'))
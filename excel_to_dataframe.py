@@ -1,131 +1,433 @@
 '''This script will take an excel file and convert it to a pandas dataframe.'''
+import glob
+import hashlib
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import config
-from logging_config import setup_logging
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; without it strings stay Python-backed and money stays float
+    pa = None
+
+logger = logging.getLogger(__name__)
 
 # Set pandas display options for better alignment and readability
 pd.set_option('display.float_format', lambda x: f"{x:,.2f}")  # Format floats to 2 decimal places
 pd.set_option('display.max_columns', None)   # Display all columns
 pd.set_option('display.width', 1000)         # Set display width to prevent wrapping
 
+# Columns to Drop
+columns_to_drop_quantity = ['Unnamed: 0', 'Unnamed: 4', 'Unnamed: 6', 'Unnamed: 7',
+                            'Unnamed: 8', 'Unnamed: 10']
+columns_to_drop_product = ['Unnamed: 0', 'Order Qty\n(Pack / Case)','Unnamed: 3',
+                           'Unnamed: 5', 'Unnamed: 7', 'Unnamed: 8', 'Unnamed: 10']
+
+desired_order = ['Code', 'Product', 'Unit', 'Qty', 'Cost per Unit', 'Total Cost']
+
+# Money columns are stored as fixed-point decimals with two places (scaled integer cents)
+MONEY_COLUMNS = ['Cost per Unit', 'Total Cost']
+
+# Spreadsheet sources are parsed once and cached as Parquet keyed by the file's hash
+SPREADSHEET_EXTENSIONS = ('.xls', '.xlsx', '.xlsm')
+
+# File name prefixes of the order and catalog exports; an order pairs with the catalog
+# whose name ends the same way (quantity_timeframe_mon.csv with product_list_mon.csv)
+ORDER_FILE_PREFIX = 'quantity_timeframe'
+CATALOG_FILE_PREFIX = 'product_list'
+
 def clean_columns(df, columns):
     """
     Clean currency columns by removing non-numeric characters and converting to float.
+    Values that are already numbers (as read from a spreadsheet) are kept as they are.
     """
     for column in columns:
         if column in df.columns:
             try:
-                df[column] = df[column].astype(str).str.replace(r'[^\d.]', '', regex=True).replace('', '0').astype(float)
+                numeric = pd.to_numeric(df[column], errors='coerce')
+                cleaned = df[column].astype(str).str.replace(r'[^\d.]', '', regex=True).replace('', '0').astype(float)
+                df[column] = numeric.fillna(cleaned)
                 df[column] = df[column].replace({'¤': '', '£': '', '$': ''}, regex=True)
-                
+
             except Exception as e:
                 print(f"Error cleaning column '{column}': {e}")
         else:
             print(f"Warning: Column '{column}' not found in DataFrame.")
     return df
 
-# Paths
-quantity_path = config.INPUT_QUANTITY_PATH
-product_path = config.INPUT_TIME_PATH
+def file_digest(path):
+    """
+    Returns the sha256 hex digest of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-# Load the CSV files
-quantity_df = pd.read_csv(quantity_path)
-product_df = pd.read_csv(product_path)
+def _to_cacheable(df):
+    """
+    Stores mixed object columns as text so they fit a Parquet schema.
+    Numbers are written with repr() so clean_columns reads back the exact same value.
+    """
+    df = df.copy()
+    df.columns = [str(column) for column in df.columns]
+    for column in df.columns[df.dtypes == object]:
+        values = df[column]
+        df[column] = values.map(lambda v: v if isinstance(v, str) else repr(v)).where(values.notna(), None)
+    return df
 
-# List headers
-# quantity_df_headings = quantity_df.columns.tolist()
-# product_df_headings = product_df.columns.tolist()
+def _from_cache(df):
+    """Restores NaN for missing text values, matching a fresh spreadsheet parse."""
+    for column in df.columns[df.dtypes == object]:
+        df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
 
-# Columns to Drop
-columns_to_drop_quantity = ['Unnamed: 0', 'Unnamed: 4', 'Unnamed: 6', 'Unnamed: 7',
-                            'Unnamed: 8', 'Unnamed: 10']
-columns_to_drop_product = ['Unnamed: 0', 'Order Qty\n(Pack / Case)','Unnamed: 3',
-                           'Unnamed: 5', 'Unnamed: 7', 'Unnamed: 8', 'Unnamed: 10']
+def read_spreadsheet(path, cache_dir=None):
+    """
+    Reads the first sheet of an .xls/.xlsx file, keeping the original numeric types.
+    The parsed sheet is cached as Parquet under cache_dir keyed by the absolute source path
+    and the source hash, so later runs on the same file skip the spreadsheet parser.
+    """
+    cache_dir = cache_dir or config.INPUT_CACHE_DIR
+    stem = os.path.splitext(os.path.basename(path))[0]
+    # Files with the same name in other folders, or as .xls and .xlsx, get their own caches
+    path_key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:8]
+    cache_prefix = f"{stem}-{path_key}-"
+    cache_path = os.path.join(cache_dir, f"{cache_prefix}{file_digest(path)[:16]}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            logger.info("Reading '%s' from cache '%s'.", path, cache_path)
+            return _from_cache(pd.read_parquet(cache_path))
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache '%s': %s", cache_path, e)
 
-# Drop specified columns
-quantity_df = quantity_df.drop(columns_to_drop_quantity, axis=1, errors='ignore')
-product_df = product_df.drop(columns_to_drop_product, axis=1, errors='ignore')
-
-# Rename columns
-quantity_df = quantity_df.rename(columns={'Description': 'Product', 'Cost per Unit': 
-                                          'Cost per Unit', 'Total': 'Total Cost'})
-product_df = product_df.rename(columns={'Description': 'Product', 'Order Size': 'Unit',
-                                        'Price': 'Cost per Unit'})
-
-# Strip whitespace from column names
-quantity_df.columns = quantity_df.columns.str.strip()
-product_df.columns = product_df.columns.str.strip()
-
-# Clean columns
-clean_columns(quantity_df, ['Cost per Unit', 'Total Cost'])
-clean_columns(product_df, ['Cost per Unit'])
-
-# Filter rows where 'Code' contains only digits
-product_df['Code'] = product_df['Code'].astype(str).str.strip()
-is_numeric = product_df['Code'].str.isdigit()
-non_numeric_count = (~is_numeric).sum()
-if non_numeric_count > 0:
-    product_df = product_df.loc[is_numeric].copy()
-# print(f"Removed {non_numeric_count} rows with non-numeric 'Code' values.")
-# print(non_numeric_count)
-# print(is_numeric)
-
-quantity_df['Product'] = quantity_df['Product'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
-product_df['Product'] = product_df['Product'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
-
-# # Print heads and shapes
-# print("\n--- Quantity DataFrame Head ---")
-# print(quantity_df.head())
-# print("\n--- Product DataFrame Head ---")
-# print(product_df.head())
-# print("\n--- Quantity DataFrame Shape:", quantity_df.shape)
-# print("--- Product DataFrame Shape:", product_df.shape)
-
-# Proceed with merging
-merged_df = pd.merge(quantity_df, product_df[['Code', 'Product']], on='Product', how='left')
-print("Merged DataFrames on 'Product'.")
-
-# Identify and count missing 'Code' entries
-missing_code = merged_df['Code'].isna().sum()
-if missing_code > 0:
-    print(f"{missing_code} rows have unmatched 'Product' and missing 'Code'. These will be dropped.")
-    merged_df = merged_df.dropna(subset=['Code']).copy()
-print(f"Merged DataFrame shape after dropping unmatched 'Code': {merged_df.shape}")
-
-# Reorder columns
-desired_order = ['Code', 'Product', 'Unit', 'Qty', 'Cost per Unit', 'Total Cost']
-merged_df = merged_df[desired_order]
-print("Reordered columns to desired order.")
-
-# Identify duplicates based on 'Description' and create Dataframe
-duplicates_mask = merged_df.duplicated(subset=['Product'], keep='first')
-duplicates_df = merged_df.loc[duplicates_mask].copy()
-
-# Keep only unique rows
-unique_df = merged_df.loc[~duplicates_mask].copy()
-
-# Reset index for both DataFrames
-unique_df.reset_index(drop=True, inplace=True)
-duplicates_df.reset_index(drop=True, inplace=True)
-
-# # Save the DataFrames to CSV files
-# print(f"Unique DataFrame shape: {unique_df.shape}")
-# print("\n--- Unique DataFrame Head ---")
-# print(unique_df.head())
-# print("\n--- Unique DataFrame Head ---")
-# print(unique_df.head())
-# unique_df.to_csv('unique_output.csv', index=False)
-# print("Unique DataFrame saved to 'unique_output.csv'.")
-
-# # Duplicates DataFrame
-# print(f"Duplicates DataFrame shape: {duplicates_df.shape}")
-# print("\n--- Duplicates DataFrame Head ---")
-# print(duplicates_df.head())
-# duplicates_df.to_csv('duplicates_output.csv', index=False)
-# print("Duplicates DataFrame saved to 'duplicates_output.csv'.")
-# # Check if 'Code' column contains non-numeric characters
-# unique_non_numerics = unique_df[unique_df['Code'].astype(str).str.contains(r'\D', regex=True)]
-# duplicates_non_numerics = duplicates_df[duplicates_df['Code'].astype(str).str.contains(r'\D', regex=True)]
-# print(f"Unique DataFrame Weird Characters: {unique_non_numerics}")
-# print(f"Duplicates DataFrame Weird Characters: {duplicates_non_numerics}")
\ No newline at end of file
+    df = pd.read_excel(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Older caches of the same file are stale once its content changes
+        for stale_path in glob.glob(os.path.join(cache_dir, f"{glob.escape(cache_prefix)}*.parquet")):
+            os.remove(stale_path)
+        temp_path = f"{cache_path}.tmp"
+        _to_cacheable(df).to_parquet(temp_path, index=False)
+        os.replace(temp_path, cache_path)
+        logger.info("Cached '%s' to '%s'.", path, cache_path)
+    except (ImportError, OSError, ValueError) as e:
+        # pyarrow is optional; without it every run parses the spreadsheet
+        logger.warning("Could not cache '%s': %s", path, e)
+    return df
+
+def read_source(path):
+    """
+    Reads an input file, dispatching on its extension (.csv or .xls/.xlsx).
+    """
+    if path.lower().endswith(SPREADSHEET_EXTENSIONS):
+        return read_spreadsheet(path)
+    return pd.read_csv(path)
+
+def load_frames(quantity_path, product_path):
+    """
+    Loads the order (quantity) and catalog (product) files.
+    Returns:
+        tuple: (quantity_df, product_df)
+    """
+    quantity_df = read_source(quantity_path)
+    product_df = read_source(product_path)
+    return quantity_df, product_df
+
+def clean_quantity(quantity_df):
+    """
+    Drops the spacer columns of the order (quantity) file, renames its headers and
+    cleans the currency and description columns.
+    """
+    quantity_df = quantity_df.drop(columns_to_drop_quantity, axis=1, errors='ignore')
+    quantity_df = quantity_df.rename(columns={'Description': 'Product', 'Cost per Unit':
+                                              'Cost per Unit', 'Total': 'Total Cost'})
+    quantity_df.columns = quantity_df.columns.str.strip()
+    clean_columns(quantity_df, ['Cost per Unit', 'Total Cost'])
+    quantity_df['Product'] = quantity_df['Product'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+    return quantity_df
+
+def clean_catalog(product_df):
+    """
+    Drops the spacer columns of the catalog (product) file, renames its headers, cleans
+    the price and description columns and keeps only rows with a numeric 'Code'.
+    """
+    product_df = product_df.drop(columns_to_drop_product, axis=1, errors='ignore')
+    product_df = product_df.rename(columns={'Description': 'Product', 'Order Size': 'Unit',
+                                            'Price': 'Cost per Unit'})
+    product_df.columns = product_df.columns.str.strip()
+    clean_columns(product_df, ['Cost per Unit'])
+
+    # Filter rows where 'Code' contains only digits
+    product_df['Code'] = product_df['Code'].astype(str).str.strip()
+    is_numeric = product_df['Code'].str.isdigit()
+    non_numeric_count = (~is_numeric).sum()
+    if non_numeric_count > 0:
+        product_df = product_df.loc[is_numeric].copy()
+    # print(f"Removed {non_numeric_count} rows with non-numeric 'Code' values.")
+
+    product_df['Product'] = product_df['Product'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+    return product_df
+
+def clean_frames(quantity_df, product_df):
+    """
+    Drops the spacer columns, renames the headers and cleans the currency,
+    code and description columns of both files.
+    Returns:
+        tuple: (quantity_df, product_df)
+    """
+    return clean_quantity(quantity_df), clean_catalog(product_df)
+
+def merge_frames(quantity_df, product_df):
+    """
+    Looks up the product code of every order line by its description.
+    Returns:
+        tuple: (merged_df, unmatched_df) where unmatched_df holds the order lines without a code.
+    """
+    merged_df = pd.merge(quantity_df, product_df[['Code', 'Product']], on='Product', how='left')
+    print("Merged DataFrames on 'Product'.")
+
+    # Identify and count missing 'Code' entries
+    missing_mask = merged_df['Code'].isna()
+    unmatched_df = merged_df.loc[missing_mask].reset_index(drop=True)
+    missing_code = int(missing_mask.sum())
+    if missing_code > 0:
+        print(f"{missing_code} rows have unmatched 'Product' and missing 'Code'. These will be dropped.")
+        merged_df = merged_df.loc[~missing_mask].copy()
+    print(f"Merged DataFrame shape after dropping unmatched 'Code': {merged_df.shape}")
+
+    # Reorder columns
+    merged_df = merged_df[desired_order]
+    print("Reordered columns to desired order.")
+    return merged_df, unmatched_df
+
+def split_duplicates(merged_df):
+    """
+    Splits the merged DataFrame into unique rows and rows repeating an earlier 'Product'.
+    Returns:
+        tuple: (unique_df, duplicates_df), both with a fresh index.
+    """
+    # Identify duplicates based on 'Description' and create Dataframe
+    duplicates_mask = merged_df.duplicated(subset=['Product'], keep='first')
+    duplicates_df = merged_df.loc[duplicates_mask].copy()
+
+    # Keep only unique rows
+    unique_df = merged_df.loc[~duplicates_mask].copy()
+
+    # Reset index for both DataFrames
+    unique_df.reset_index(drop=True, inplace=True)
+    duplicates_df.reset_index(drop=True, inplace=True)
+    return unique_df, duplicates_df
+
+def to_cents(series):
+    """
+    Converts a float money column to a fixed-point decimal128(18, 2) column.
+    The values are rounded to whole cents once and stored as scaled integers.
+    """
+    cents = (series.astype(float) * 100).round().astype('int64').to_numpy()
+    # decimal128 stores each value as a little-endian 128-bit integer: low word, then sign
+    words = np.empty((len(cents), 2), dtype='<i8')
+    words[:, 0] = cents
+    words[:, 1] = cents >> 63
+    array = pa.Array.from_buffers(pa.decimal128(18, 2), len(cents), [None, pa.py_buffer(words)])
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=series.index, name=series.name)
+
+def compact_dtypes(df):
+    """
+    Gives the ingested rows compact, explicit dtypes: Arrow-backed strings for 'Code'
+    and 'Product', categorical 'Unit', integer 'Qty' and fixed-point money columns.
+    """
+    string_dtype = 'string[pyarrow]' if pa is not None else 'string'
+    df = df.astype({'Code': string_dtype, 'Product': string_dtype, 'Unit': 'category'})
+    qty = df['Qty'].dropna()
+    if qty.eq(qty.round()).all():
+        df['Qty'] = df['Qty'].astype('Int32')
+    else:
+        # Part cases (e.g. 0.25) would be truncated, so those files keep float quantities
+        logger.warning("'Qty' has fractional values; keeping it as float.")
+    if pa is not None:
+        for column in MONEY_COLUMNS:
+            df[column] = to_cents(df[column])
+    return df
+
+def load_input(quantity_path=None, product_path=None, with_details=False):
+    """
+    Runs the full ingestion pipeline: load, clean, merge and de-duplicate.
+    Args:
+        quantity_path (str, optional): The order file. Defaults to INPUT_QUANTITY_PATH.
+        product_path (str, optional): The catalog file. Defaults to INPUT_TIME_PATH.
+        with_details (bool): Also return the duplicate and unmatched rows.
+    Returns:
+        pd.DataFrame: unique_df, or (unique_df, duplicates_df, unmatched_df) with details.
+    """
+    quantity_df, product_df = load_frames(quantity_path or config.INPUT_QUANTITY_PATH,
+                                          product_path or config.INPUT_TIME_PATH)
+    quantity_df, product_df = clean_frames(quantity_df, product_df)
+    merged_df, unmatched_df = merge_frames(quantity_df, product_df)
+    # Release the source frames before de-duplicating
+    del quantity_df, product_df
+    unique_df, duplicates_df = split_duplicates(merged_df)
+    del merged_df
+    unique_df = compact_dtypes(unique_df)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Input rows use %s bytes.", unique_df.memory_usage(deep=True).sum())
+    logger.info("Loaded %s unique rows (%s duplicates, %s unmatched).",
+                len(unique_df), len(duplicates_df), len(unmatched_df))
+    if with_details:
+        return unique_df, duplicates_df, unmatched_df
+    return unique_df
+
+def validate_input(unique_df, duplicates_df=None, unmatched_df=None):
+    """
+    Pre-checks the ingested rows for problems that would fail or be rejected on the web form.
+    Returns:
+        pd.DataFrame: One row per issue with the offending input values.
+    """
+    report_columns = ['Code', 'Product', 'Qty', 'Cost per Unit', 'Total Cost']
+    qty = unique_df['Qty'].astype(float)
+    cost_per_unit = unique_df['Cost per Unit'].astype(float)
+    total_cost = unique_df['Total Cost'].astype(float)
+    checks = {
+        'Missing or non-positive Qty': qty.isna() | (qty <= 0),
+        'Qty is not a whole number': qty.notna() & (qty != qty.round()),
+        'Cost per Unit is zero': cost_per_unit == 0,
+        # Same tolerance as the comparison against the web total in simplified.loop
+        'Total Cost does not equal Qty x Cost per Unit': ~np.isclose(
+            total_cost, qty * cost_per_unit, rtol=1e-4, atol=0.0),
+    }
+    issues = [unique_df.loc[mask, report_columns].assign(Issue=issue).rename_axis('Index').reset_index()
+              for issue, mask in checks.items() if mask.any()]
+    if duplicates_df is not None and not duplicates_df.empty:
+        issues.append(duplicates_df[report_columns].assign(Issue='Duplicate Product (skipped)', Index=None))
+    if unmatched_df is not None and not unmatched_df.empty:
+        # Blank spacer lines of the export have no description and are not worth reporting
+        described = ~unmatched_df['Product'].isin(['nan', ''])
+        if described.any():
+            issues.append(unmatched_df.loc[described].reindex(columns=report_columns)
+                          .assign(Issue='No Code for Product (skipped)', Index=None))
+    if not issues:
+        return pd.DataFrame(columns=['Index', 'Issue'] + report_columns)
+    return pd.concat(issues, ignore_index=True)[['Index', 'Issue'] + report_columns]
+
+def find_order_pairs(directory):
+    """
+    Finds the order exports in a directory and the catalog export each one is checked against.
+    An order saved in several formats is ingested once, from the .csv copy (the format the
+    single-order workflow saves by hand), or else from the first spreadsheet by extension.
+    An order without a catalog of the same name suffix uses the newest catalog in the directory,
+    and the pair carries a warning saying so.
+    Returns:
+        list of tuple: (order_path, catalog_path, warning) triples; warning is '' for an exact match.
+    """
+    orders, catalogs = {}, {}
+    for name in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(name)
+        if extension.lower() not in ('.csv',) + SPREADSHEET_EXTENSIONS:
+            continue
+        path = os.path.join(directory, name)
+        if stem.startswith(ORDER_FILE_PREFIX):
+            orders.setdefault(stem, {})[extension.lower()] = path
+        elif stem.startswith(CATALOG_FILE_PREFIX):
+            catalogs.setdefault(stem[len(CATALOG_FILE_PREFIX):], {})[extension.lower()] = path
+    if not catalogs:
+        return []
+    newest = max((path for paths in catalogs.values() for path in paths.values()), key=os.path.getmtime)
+    pairs = []
+    for stem, paths in orders.items():
+        extension = '.csv' if '.csv' in paths else min(paths)
+        order_path = paths[extension]
+        if len(paths) > 1:
+            logger.info("'%s' exists in several formats; ingesting '%s'.", stem, os.path.basename(order_path))
+        same_suffix = catalogs.get(stem[len(ORDER_FILE_PREFIX):], {})
+        warning = ''
+        if not same_suffix:
+            warning = f"No {CATALOG_FILE_PREFIX} export with the same name suffix; checked against the newest catalog."
+            logger.warning("%s: %s", os.path.basename(order_path), warning)
+        # The export of the same format is preferred when both .csv and .xls are present
+        catalog_path = same_suffix.get(extension) or next(iter(same_suffix.values()), newest)
+        pairs.append((order_path, catalog_path, warning))
+    return pairs
+
+# Cleaned catalogs shared by the ingest worker processes, keyed by catalog path
+_worker_catalogs = {}
+
+def _init_ingest_worker(catalogs):
+    """Receives the cleaned catalogs once per worker process instead of once per order."""
+    _worker_catalogs.update(catalogs)
+
+def _ingest_order(order_path, catalog_path, output_dir, warning=''):
+    """
+    Cleans, merges and de-duplicates one order against its shared catalog and writes
+    the work item and the ingest report. Runs in a worker process.
+    Returns:
+        dict: One row of the ingest summary.
+    """
+    started = time.perf_counter()
+    name = os.path.basename(order_path)
+    row = {'Order': name, 'Catalog': os.path.basename(catalog_path), 'Warning': warning}
+    try:
+        quantity_df = clean_quantity(read_source(order_path))
+        merged_df, unmatched_df = merge_frames(quantity_df, _worker_catalogs[catalog_path])
+        unique_df, duplicates_df = split_duplicates(merged_df)
+        unique_df = compact_dtypes(unique_df)
+        issues_df = validate_input(unique_df, duplicates_df, unmatched_df)
+        work_item_path = os.path.join(output_dir, f"{name}.parquet")
+        unique_df.to_parquet(work_item_path, index=False)
+        report_path = os.path.join(output_dir, f"{name}.issues.csv")
+        issues_df.to_csv(report_path, index=False)
+        row.update({'Rows': len(unique_df), 'Duplicates': len(duplicates_df),
+                    'Unmatched': len(unmatched_df), 'Issues': len(issues_df),
+                    'Work Item': work_item_path, 'Report': report_path, 'Error': ''})
+    except Exception as e:
+        logger.error("Failed to ingest '%s': %s", order_path, e, exc_info=True)
+        row['Error'] = str(e)
+    row['Seconds'] = round(time.perf_counter() - started, 3)
+    return row
+
+def ingest_directory(directory, output_dir=None, workers=None):
+    """
+    Prepares every order export in a directory for entry, in parallel.
+    Each catalog is read and cleaned once and shared with the worker processes. Every order
+    gets a work item (its ready-to-run rows as Parquet, see load_work_item) and a CSV of
+    the issues validate_input finds; ingest_summary.csv lists them all.
+    Args:
+        directory (str): Directory holding the order and catalog exports.
+        output_dir (str, optional): Where to write the results. Defaults to WORK_ITEMS_DIR.
+        workers (int, optional): Worker processes. Defaults to one per CPU.
+    Returns:
+        pd.DataFrame: The ingest summary, one row per order.
+    """
+    output_dir = output_dir or config.WORK_ITEMS_DIR
+    pairs = find_order_pairs(directory)
+    if not pairs:
+        logger.warning("No order and catalog exports found in '%s'.", directory)
+        return pd.DataFrame()
+    os.makedirs(output_dir, exist_ok=True)
+    # Only the columns merge_frames needs are sent to the workers
+    catalogs = {path: clean_catalog(read_source(path))[['Code', 'Product']]
+                for path in dict.fromkeys(catalog_path for _, catalog_path, _ in pairs)}
+    workers = min(workers or os.cpu_count() or 1, len(pairs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_ingest_worker,
+                             initargs=(catalogs,)) as executor:
+        futures = [executor.submit(_ingest_order, order_path, catalog_path, output_dir, warning)
+                   for order_path, catalog_path, warning in pairs]
+        summary_df = pd.DataFrame([future.result() for future in futures])
+    # Orders that failed have no counts; the others stay whole numbers
+    count_columns = summary_df.columns.intersection(['Rows', 'Duplicates', 'Unmatched', 'Issues'])
+    summary_df[count_columns] = summary_df[count_columns].astype('Int64')
+    summary_df.to_csv(os.path.join(output_dir, 'ingest_summary.csv'), index=False)
+    logger.info("Ingested %s orders from '%s' with %s workers.", len(pairs), directory, workers)
+    return summary_df
+
+def load_work_item(path):
+    """
+    Loads the rows of a work item written by ingest_directory, with the same dtypes as load_input.
+    """
+    df = pd.read_parquet(path)
+    for column in MONEY_COLUMNS:
+        df[column] = df[column].astype(float)
+    return compact_dtypes(df)
@@ -1,32 +1,72 @@
 # helpers/__init__.py
-"""This module initializes the package by importing all 
-the necessary functions from the submodules."""
-from helpers.login import (
-    login_sequence,
-    click_got_it_button,
-    select_business,
-    select_delivery,
-    select_carryout,
-    set_up,
-)
-from helpers.transfer import save_errors, log_error
-from helpers.utilities import (initialize_driver, close_driver, close_form, save_form)
-from helpers.data_entry_validation import (fill_fields, get_total_costs, extract_all_cells)
+"""This module initializes the package by mapping all the necessary
+functions to their submodules. Submodules are imported on first use so that
+commands which never open the browser do not pay for importing selenium."""
+import importlib
 
-__all__ = [
-    "initialize_driver",
-    "login_sequence",
-    "click_got_it_button",
-    "select_business",
-    "select_delivery",
-    "select_carryout",
-    "set_up",
-    "extract_all_cells",
-    "fill_fields",
-    "save_errors",
-    "close_form",
-    "close_driver",
-    "get_total_costs",
-    "log_error",
-    "save_form"
-]
+_EXPORTS = {
+    "login_sequence": "helpers.login",
+    "click_got_it_button": "helpers.login",
+    "select_business": "helpers.login",
+    "select_delivery": "helpers.login",
+    "select_carryout": "helpers.login",
+    "set_up": "helpers.login",
+    "start_session": "helpers.login",
+    "save_errors": "helpers.transfer",
+    "log_error": "helpers.transfer",
+    "log_item_error": "helpers.transfer",
+    "new_errors_df": "helpers.transfer",
+    "ERROR_COLUMNS": "helpers.transfer",
+    "initialize_driver": "helpers.utilities",
+    "close_driver": "helpers.utilities",
+    "close_form": "helpers.utilities",
+    "save_form": "helpers.utilities",
+    "fill_fields": "helpers.data_entry_validation",
+    "get_total_costs": "helpers.data_entry_validation",
+    "fill_and_read_total": "helpers.data_entry_validation",
+    "extract_all_cells": "helpers.data_entry_validation",
+    "search_product": "helpers.data_entry_validation",
+    "wait_for_first_result": "helpers.data_entry_validation",
+    "extract_catalog_pages": "helpers.data_entry_validation",
+    "SEARCH_TABLE_XPATH": "helpers.data_entry_validation",
+    "hash_rows": "helpers.incremental",
+    "load_submitted": "helpers.incremental",
+    "save_submitted": "helpers.incremental",
+    "diff_against_submitted": "helpers.incremental",
+    "removed_rows": "helpers.incremental",
+    "load_run_summary": "helpers.report",
+    "save_run_summary": "helpers.report",
+    "new_run_summary": "helpers.report",
+    "record_outcome": "helpers.report",
+    "write_report": "helpers.report",
+    "save_catalog_snapshot": "helpers.catalog",
+    "snapshot_synced_at": "helpers.catalog",
+    "check_against_catalog": "helpers.catalog",
+    "ProgressTracker": "helpers.progress",
+    "serve_status": "helpers.progress",
+    "BrowserWatchdog": "helpers.watchdog",
+    "recycle_driver": "helpers.watchdog",
+    "BackgroundWriter": "helpers.writer",
+    "capture_search": "helpers.network",
+    "search_rows": "helpers.network",
+    "new_lookup_client": "helpers.lookup",
+    "update_cookies": "helpers.lookup",
+    "lookup_product": "helpers.lookup",
+    "lookup_products": "helpers.lookup",
+    "PlanItem": "helpers.plan",
+    "compile_plan": "helpers.plan",
+    "write_checkpoint": "helpers.writer",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Imports the submodule that defines `name` the first time it is requested."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'helpers' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
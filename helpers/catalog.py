@@ -0,0 +1,83 @@
+# helpers/catalog.py
+'''Functions to keep a local snapshot of the supplier catalog and check input rows against it.'''
+import logging
+import os
+import sqlite3
+from datetime import datetime
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+def save_catalog_snapshot(catalog, filepath):
+    """
+    Stores the catalog rows extracted from the search modal in an indexed SQLite file.
+    Args:
+        catalog (list of dict): Rows with 'Product Code' and 'Product' keys.
+        filepath (str): Path of the snapshot file. An existing snapshot is replaced.
+    Returns:
+        int: The number of distinct catalog rows stored.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp_path = f"{filepath}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.execute("CREATE TABLE catalog (code TEXT NOT NULL, product TEXT NOT NULL, "
+                           "PRIMARY KEY (code, product))")
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.executemany("INSERT OR IGNORE INTO catalog VALUES (?, ?)",
+                               ((row['Product Code'], row['Product'])
+                                for row in catalog if row.get('Product Code')))
+        connection.execute("INSERT INTO meta VALUES ('synced_at', ?)",
+                           (datetime.now().isoformat(timespec='seconds'),))
+        connection.commit()
+        count = connection.execute("SELECT COUNT(*) FROM catalog").fetchone()[0]
+    finally:
+        connection.close()
+    os.replace(temp_path, filepath)
+    logger.info("Catalog snapshot with %s rows saved to '%s'.", count, filepath)
+    return count
+
+def snapshot_synced_at(filepath):
+    """
+    Returns when the snapshot was taken, or None if there is no snapshot.
+    """
+    if not os.path.exists(filepath):
+        return None
+    connection = sqlite3.connect(filepath)
+    try:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'synced_at'").fetchone()
+        return row[0] if row else None
+    finally:
+        connection.close()
+
+def check_against_catalog(df, filepath):
+    """
+    Checks every Code/Product pair of the input against the catalog snapshot,
+    using the same exact comparison as the search-table match in simplified.loop.
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        filepath (str): Path of the snapshot file.
+    Returns:
+        pd.DataFrame: The rows that are not in the catalog, indexed like df, with a 'Reason' column.
+    """
+    pairs = zip(df.index.tolist(), df['Code'].astype(str).str.strip(), df['Product'].astype(str).str.strip())
+    connection = sqlite3.connect(filepath)
+    try:
+        # A temporary table keeps the lookup on the primary key index without writing to the snapshot
+        connection.execute("CREATE TEMP TABLE input_rows (row_index INTEGER, code TEXT, product TEXT)")
+        connection.executemany("INSERT INTO input_rows VALUES (?, ?, ?)", pairs)
+        unknown = pd.read_sql_query(
+            "SELECT row_index, "
+            "CASE WHEN EXISTS (SELECT 1 FROM catalog c WHERE c.code = i.code) "
+            "THEN 'Description differs from catalog' ELSE 'Code not in catalog' END AS reason "
+            "FROM input_rows i "
+            "WHERE NOT EXISTS (SELECT 1 FROM catalog c WHERE c.code = i.code AND c.product = i.product)",
+            connection)
+    finally:
+        connection.close()
+    unknown_df = df.loc[unknown['row_index']].copy()
+    unknown_df['Reason'] = unknown['reason'].to_numpy()
+    return unknown_df
@@ -7,9 +7,125 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (NoSuchElementException, TimeoutException,
                                         WebDriverException)
+from helpers.plan import PlanItem
 
 logger = logging.getLogger(__name__)
 
+SEARCH_BUTTON_ID = "web-md-button-189fl7lckkbbqvmi"
+SEARCH_INPUT_ID = "web-input-189fl7nukkbbymu9"
+SEARCH_TABLE_XPATH = ".//table[contains(@id, 'web-table')]"
+NEXT_PAGE_XPATH = "//div[@class='md-dialog-container ng-scope']//md-table-pagination//button[@aria-label='Next Page' or contains(@ng-click, 'next()')]"
+QUANTITY_INPUT_ID = "web-input-189fl7q9kkbc4430-0"
+UNIT_COST_INPUT_ID = "web-input-189fl7q9kkbc4436-0"
+FIRST_RESULT_ROW_XPATH = "//div[@class='md-dialog-container ng-scope']//table[contains(@id, 'web-table')]//tr[contains(@class, 'md-row')]"
+TOTAL_COST_XPATH = "//td[contains(@class, 'text-right no-white-space-wrap md-cell ng-binding ng-scope') and not(contains(., 'context.viewQuantityOrdered'))]"
+
+# Waits for both inputs, sets them through the native value setter, fires the events ng-model
+# listens to and polls the total cell until Angular has recomputed it. Resolves with the cell text.
+FILL_AND_READ_SCRIPT = """
+var quantity = arguments[0], unitCost = arguments[1], quantityId = arguments[2],
+    unitCostId = arguments[3], totalXpath = arguments[4], timeoutMs = arguments[5],
+    done = arguments[arguments.length - 1];
+var waitStarted = Date.now();
+(function waitForInputs() {
+    var quantityInput = document.getElementById(quantityId);
+    var unitCostInput = document.getElementById(unitCostId);
+    if (quantityInput && unitCostInput) {
+        fill(quantityInput, unitCostInput);
+    } else if (Date.now() - waitStarted > timeoutMs) {
+        done({error: 'Quantity or unit cost input not found.'});
+    } else {
+        setTimeout(waitForInputs, 25);
+    }
+})();
+function totalText() {
+    var cell = document.evaluate(totalXpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return cell && cell.offsetParent !== null ? cell.textContent.trim() : '';
+}
+function fill(quantityInput, unitCostInput) {
+    var before = totalText();
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    [[quantityInput, quantity], [unitCostInput, unitCost]].forEach(function (pair) {
+        pair[0].focus();
+        setValue.call(pair[0], pair[1]);
+        ['input', 'change', 'blur'].forEach(function (type) {
+            pair[0].dispatchEvent(new Event(type, {bubbles: true}));
+        });
+    });
+    var started = Date.now();
+    (function poll() {
+        var text = totalText();
+        var elapsed = Date.now() - started;
+        // An unchanged total is accepted after a short settle time, e.g. when it already matched
+        if (text && (text !== before || elapsed > 500)) {
+            done({text: text});
+        } else if (elapsed > timeoutMs) {
+            done({error: 'Total cost did not update within ' + timeoutMs + ' ms.', text: text});
+        } else {
+            setTimeout(poll, 25);
+        }
+    })();
+}
+"""
+
+def search_product(driver, product_code):
+    """
+    Opens the product search modal and types the product code into its search box.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance.
+        product_code (str): The code to search for. An empty string lists the whole catalog.
+    """
+    search_button = WebDriverWait(driver, 20).until(EC.element_to_be_clickable((By.ID, SEARCH_BUTTON_ID)))
+    driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
+    driver.execute_script("document.querySelectorAll('.md-scroll-mask').forEach(e => e.remove());")
+    driver.execute_script("arguments[0].click();", search_button)
+    search_textbox = WebDriverWait(driver, 20).until(EC.visibility_of_element_located((By.ID, SEARCH_INPUT_ID)))
+    search_textbox.clear()
+    if product_code:
+        search_textbox.send_keys(product_code)
+
+# Returns the text of the product code cell of the first search result, or null while there is none.
+FIRST_RESULT_CODE_SCRIPT = """
+var row = document.evaluate(arguments[0], document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+var cells = row ? row.querySelectorAll('td') : [];
+return cells.length > 1 ? cells[1].textContent : null;
+"""
+
+def wait_for_first_result(driver, product_code, timeout=30):
+    """
+    Waits until the first row of the search results is the product searched for.
+    The Qty and Cost per Unit inputs belong to that row, so filling while the table still shows
+    the previous results would enter the line on another product.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance.
+        product_code (str): The code that was searched for.
+        timeout (int): Seconds to wait for the table to re-render.
+    Raises:
+        TimeoutException: If the first row does not show product_code in time.
+    """
+    def first_code(d):
+        text = d.execute_script(FIRST_RESULT_CODE_SCRIPT, FIRST_RESULT_ROW_XPATH)
+        return ' '.join(text.split()) if text else None
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: first_code(d) == product_code)
+    except TimeoutException:
+        raise TimeoutException(f"The first search result is {first_code(driver)!r}, not {product_code}; "
+                               f"the line was not filled.")
+
+def field_values(fill_data):
+    """
+    Returns the Qty and Cost per Unit strings that are entered on the web form.
+    Args:
+        fill_data (PlanItem or pd.Series): A work plan item, or the DataFrame row data.
+    """
+    if isinstance(fill_data, PlanItem):
+        if fill_data.qty_keys is None or fill_data.cost_keys is None:
+            raise ValueError(f"Row {fill_data.index} has no Qty or Cost per Unit to enter.")
+        return fill_data.qty_keys, fill_data.cost_keys
+    return str(int(fill_data["Qty"])), str(int(fill_data["Cost per Unit"]))
+
 def fill_fields(driver, fill_data):
     """
     Fills in the web form fields based on the DataFrame row data.
@@ -20,15 +136,14 @@ def fill_fields(driver, fill_data):
         bool: True if fields are filled successfully, False otherwise.
     """
     try:
-        quantity = int(fill_data["Qty"])
-        cost_per_unit = int(fill_data["Cost per Unit"])
+        quantity, cost_per_unit = field_values(fill_data)
         logger.info("Filling fields: Qty=%s, Cost per Unit=%s", quantity, cost_per_unit)
-        quantity_input = WebDriverWait(driver, 50).until(EC.element_to_be_clickable((By.ID, "web-input-189fl7q9kkbc4430-0")))
+        quantity_input = WebDriverWait(driver, 50).until(EC.element_to_be_clickable((By.ID, QUANTITY_INPUT_ID)))
         quantity_input.clear()
-        quantity_input.send_keys(str(quantity))
-        unit_cost_input = WebDriverWait(driver, 50).until(EC.element_to_be_clickable((By.ID, "web-input-189fl7q9kkbc4436-0")))
+        quantity_input.send_keys(quantity)
+        unit_cost_input = WebDriverWait(driver, 50).until(EC.element_to_be_clickable((By.ID, UNIT_COST_INPUT_ID)))
         unit_cost_input.clear()
-        unit_cost_input.send_keys(str(cost_per_unit))
+        unit_cost_input.send_keys(cost_per_unit)
         return True
     except (NoSuchElementException, TimeoutException) as e:
         logger.error("An error occurred while filling fields: %s", e, exc_info=True)
@@ -44,8 +159,7 @@ def get_total_costs(driver, df, row_index):
     try:
         total_cost_df = float(df.loc[row_index, "Total Cost"])
         logger.info("Expecting Total Cost: %s", total_cost_df)
-        total_cost_xpath = "//td[contains(@class, 'text-right no-white-space-wrap md-cell ng-binding ng-scope') and not(contains(., 'context.viewQuantityOrdered'))]"
-        total_cost_element = WebDriverWait(driver, timeout=20).until(EC.visibility_of_element_located((By.XPATH, total_cost_xpath)))
+        total_cost_element = WebDriverWait(driver, timeout=20).until(EC.visibility_of_element_located((By.XPATH, TOTAL_COST_XPATH)))
         total_cost_text = total_cost_element.text.strip().replace(",", "")
         total_cost_web = float(total_cost_text)
         logger.info("Total Cost encountered: '%s'", total_cost_web)
@@ -54,6 +168,35 @@ def get_total_costs(driver, df, row_index):
         traceback.print_exc()
     return total_cost_df, total_cost_web
 
+def fill_and_read_total(driver, fill_data, timeout=20):
+    """
+    Fills Qty and Cost per Unit and reads the recomputed total cost in a single
+    in-page script call instead of separate waits, keystrokes and reads.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance.
+        fill_data (PlanItem or pd.Series): A work plan item, or the DataFrame row data.
+        timeout (int): Seconds to wait for the total cost to update.
+    Returns:
+        float: The total cost displayed on the web form.
+    Raises:
+        NoSuchElementException: If the input fields are not on the page.
+        TimeoutException: If the total cost does not update in time.
+    """
+    quantity, cost_per_unit = field_values(fill_data)
+    logger.info("Filling fields: Qty=%s, Cost per Unit=%s", quantity, cost_per_unit)
+    # The script times out on its own first so its error message is reported
+    driver.set_script_timeout(timeout + 5)
+    result = driver.execute_async_script(FILL_AND_READ_SCRIPT, quantity, cost_per_unit,
+                                         QUANTITY_INPUT_ID, UNIT_COST_INPUT_ID,
+                                         TOTAL_COST_XPATH, timeout * 1000)
+    if 'error' in result:
+        if 'text' not in result:
+            raise NoSuchElementException(result['error'])
+        raise TimeoutException(result['error'])
+    total_cost_web = float(result['text'].replace(",", ""))
+    logger.info("Total Cost encountered: '%s'", total_cost_web)
+    return total_cost_web
+
 def extract_all_cells(driver, table_xpath, timeout=20):
     """
     Extracts all cell texts from all rows within a specified table in a modal dialog.
@@ -80,3 +223,39 @@ def extract_all_cells(driver, table_xpath, timeout=20):
     except Exception as e:
         logger.error("An error occurred while extracting all cells: %s", e, exc_info=True)
         return []
+
+def extract_catalog_pages(driver, timeout=30, max_pages=1000):
+    """
+    Pages through the product table of the open search modal and extracts every row.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance.
+        timeout (int): Seconds to wait for each page to load.
+        max_pages (int): Safety limit on the number of pages read.
+    Returns:
+        list of dict: 'Product Code' and 'Product' of every catalog row.
+    Raises:
+        TimeoutException: If a page did not load after clicking Next Page, since the
+            rows read so far are only part of the catalog.
+    """
+    catalog = []
+    page = extract_all_cells(driver, table_xpath=SEARCH_TABLE_XPATH, timeout=timeout)
+    for page_num in range(1, max_pages + 1):
+        catalog.extend(page)
+        logger.info("Catalog page %s: %s rows (%s total).", page_num, len(page), len(catalog))
+        try:
+            next_button = driver.find_element(By.XPATH, NEXT_PAGE_XPATH)
+        except NoSuchElementException:
+            break
+        if not next_button.is_enabled() or next_button.get_attribute('disabled'):
+            break
+        driver.execute_script("arguments[0].click();", next_button)
+        previous_page = page
+        try:
+            # The table is re-rendered in place, so wait until its content changes
+            WebDriverWait(driver, timeout).until(lambda d: extract_all_cells(
+                d, table_xpath=SEARCH_TABLE_XPATH, timeout=timeout) not in ([], previous_page))
+        except TimeoutException:
+            raise TimeoutException(f"Catalog page {page_num + 1} did not load after clicking Next Page; "
+                                   f"only {len(catalog)} rows were read.")
+        page = extract_all_cells(driver, table_xpath=SEARCH_TABLE_XPATH, timeout=timeout)
+    return catalog
@@ -0,0 +1,85 @@
+# helpers/incremental.py
+'''Functions to remember submitted rows so corrected order files only re-enter changed lines.'''
+import hashlib
+import json
+import logging
+import os
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+# Columns whose content decides whether a row has to be entered again.
+HASHED_COLUMNS = ['Code', 'Qty', 'Cost per Unit', 'Total Cost']
+
+def hash_rows(df):
+    """
+    Hashes the Code/Qty/Cost per Unit/Total Cost content of every row.
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+    Returns:
+        pd.Series: A sha1 hex digest per row, aligned with the DataFrame index.
+    """
+    codes = df['Code'].astype(str).str.strip()
+    # Format numbers the same way regardless of the column dtype so hashes stay stable.
+    numbers = [df[column].astype(float).map('{:.2f}'.format) for column in HASHED_COLUMNS[1:]]
+    content = codes.str.cat(numbers, sep='|')
+    return content.map(lambda text: hashlib.sha1(text.encode('utf-8')).hexdigest())
+
+def load_submitted(filepath):
+    """
+    Loads the store of submitted rows.
+    Args:
+        filepath (str): Path to the JSON store.
+    Returns:
+        dict: Mapping of product code to the content hash of the row that was entered.
+    """
+    if not os.path.exists(filepath):
+        return {}
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error("Failed to read submitted rows from '%s': %s", filepath, e, exc_info=True)
+        return {}
+
+def save_submitted(submitted, filepath):
+    """
+    Writes the store of submitted rows, replacing the previous file in one step.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(submitted, f, indent=0, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+    logger.info("Saved %s submitted rows to '%s'.", len(submitted), filepath)
+
+def diff_against_submitted(df, submitted):
+    """
+    Compares the input DataFrame with the rows entered by a previous run.
+    Args:
+        df (pd.DataFrame): The new input DataFrame.
+        submitted (dict): Mapping of product code to content hash from load_submitted.
+    Returns:
+        tuple: (pending_df, removed_codes) where pending_df holds only added or changed
+        rows, keeping their index in df, and removed_codes lists codes no longer in the input.
+    """
+    hashes = hash_rows(df)
+    codes = df['Code'].astype(str).str.strip()
+    previous = codes.map(submitted)
+    pending_mask = previous.isna() | (previous != hashes)
+    pending_df = df.loc[pending_mask]
+    current_codes = set(codes)
+    removed_codes = sorted(code for code in submitted if code not in current_codes)
+    print(f"Incremental run: {int(pending_mask.sum())} added or changed rows, "
+          f"{len(df) - int(pending_mask.sum())} unchanged, {len(removed_codes)} removed.")
+    return pending_df, removed_codes
+
+def removed_rows(removed_codes):
+    """
+    Builds a DataFrame listing lines that were submitted before but are missing from the new input.
+    """
+    return pd.DataFrame({'Code': removed_codes,
+                         'Note': 'Entered by a previous run but no longer in the input file.'})
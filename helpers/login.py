@@ -171,3 +171,16 @@ def set_up(driver):
 
     except (NoSuchElementException,TimeoutException, WebDriverException) as e:
         print(f"Failed to set details: {e}")
+
+def start_session(driver):
+    """
+    Logs in and opens a new carryout form ready for line entry.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance.
+    """
+    login_sequence(driver)
+    click_got_it_button(driver)
+    select_business(driver)
+    select_delivery(driver)
+    select_carryout(driver)
+    set_up(driver)
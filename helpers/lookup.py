@@ -0,0 +1,86 @@
+# helpers/lookup.py
+'''Product search lookups sent straight to the backend with the browser's session cookies.'''
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import urllib3
+from config import HTTP_SEARCH_URL, HTTP_LOOKUP_WORKERS, HTTP_LOOKUP_TIMEOUT
+from helpers.network import search_rows
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+def new_lookup_client(driver, workers=HTTP_LOOKUP_WORKERS):
+    """
+    Creates a pooled HTTP client that sends requests as the browser's logged-in session.
+    Args:
+        driver (webdriver): A logged-in Selenium WebDriver instance.
+        workers (int): Number of connections kept per host; matches the lookup threads.
+    Returns:
+        urllib3.PoolManager: The client.
+    """
+    client = urllib3.PoolManager(maxsize=workers, block=True, headers={
+        'Accept': 'application/json',
+        'User-Agent': driver.execute_script("return navigator.userAgent;"),
+    })
+    update_cookies(client, driver)
+    return client
+
+def update_cookies(client, driver):
+    """
+    Copies the browser's current session cookies onto the client, e.g. after the driver was recycled.
+    """
+    cookies = driver.get_cookies()
+    client.headers['Cookie'] = '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+    # AngularJS sends its XSRF cookie back as a header; the backend may require it
+    for cookie in cookies:
+        if cookie['name'] == 'XSRF-TOKEN':
+            client.headers['X-XSRF-TOKEN'] = cookie['value']
+
+def lookup_product(client, product_code, url_template=HTTP_SEARCH_URL, timeout=HTTP_LOOKUP_TIMEOUT):
+    """
+    Runs one product search against the backend.
+    Args:
+        client (urllib3.PoolManager): Client from new_lookup_client.
+        product_code (str): The code to search for.
+        url_template (str): Search URL with a {code} placeholder.
+        timeout (float): Seconds to wait for the response.
+    Returns:
+        list of dict: 'Product Code' and 'Product' of each product found.
+    Raises:
+        urllib3.exceptions.HTTPError: If the request fails or the status is not 200.
+        ValueError: If the response is not JSON or has no product list at SEARCH_RESULTS_FIELD.
+    """
+    url = url_template.format(code=quote(product_code, safe=''))
+    response = client.request('GET', url, timeout=timeout, retries=urllib3.Retry(2, redirect=False))
+    if response.status != 200:
+        # A redirect usually means the session expired and the login page was served
+        raise urllib3.exceptions.HTTPError(f"Product search for {product_code} returned HTTP {response.status}.")
+    return search_rows(json.loads(response.data.decode('utf-8')))
+
+def lookup_products(client, product_codes, workers=HTTP_LOOKUP_WORKERS, url_template=HTTP_SEARCH_URL,
+                    timeout=HTTP_LOOKUP_TIMEOUT):
+    """
+    Looks up several product codes concurrently.
+    Args:
+        client (urllib3.PoolManager): Client from new_lookup_client.
+        product_codes (iterable of str): Codes to search for; repeats are looked up once.
+        workers (int): Number of concurrent requests.
+        url_template (str): Search URL with a {code} placeholder.
+        timeout (float): Seconds to wait for each response.
+    Returns:
+        dict: Search rows by product code. Codes whose lookup failed are left out,
+            so the caller can fall back to searching in the browser.
+    """
+    codes = list(dict.fromkeys(product_codes))
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lookup') as executor:
+        futures = {code: executor.submit(lookup_product, client, code, url_template, timeout) for code in codes}
+        for code, future in futures.items():
+            try:
+                results[code] = future.result()
+            except (urllib3.exceptions.HTTPError, ValueError) as e:
+                logger.warning("Lookup of product %s failed: %s", code, e)
+    logger.info("Looked up %s of %s products over HTTP.", len(results), len(codes))
+    return results
@@ -0,0 +1,124 @@
+# helpers/network.py
+'''Reads product search results from the backend JSON responses captured through DevTools.'''
+import base64
+import json
+import logging
+import re
+import time
+from urllib.parse import quote
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config import (SEARCH_URL_PATTERN, SEARCH_RESULTS_FIELD, SEARCH_CODE_FIELD,
+                    SEARCH_DESCRIPTION_FIELD)
+from helpers.data_entry_validation import search_product
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+def enable_network_capture(options):
+    """
+    Turns on the performance log, which carries the DevTools network events, in the driver options.
+    """
+    options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+
+def start_network_capture(driver):
+    """
+    Enables the DevTools network domain so response bodies can be read back.
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+
+def _field(record, path):
+    """Returns the value at a dotted path such as 'data.items', or the record itself for ''."""
+    for key in path.split('.') if path else []:
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+def _text(value):
+    """Formats a JSON value like the rendered table cell, with whitespace collapsed."""
+    return ' '.join(str(value).split()) if value is not None else ''
+
+def search_rows(payload, results_field=SEARCH_RESULTS_FIELD, code_field=SEARCH_CODE_FIELD,
+                description_field=SEARCH_DESCRIPTION_FIELD):
+    """
+    Turns a product search response into the rows extract_all_cells returns for the table.
+    Args:
+        payload: The decoded JSON response.
+        results_field (str): Dotted path to the list of products; '' if the response is the list.
+        code_field (str): Dotted path to the product code within each product.
+        description_field (str): Dotted path to the description within each product.
+    Returns:
+        list of dict: 'Product Code' and 'Product' of each product in the response.
+    Raises:
+        ValueError: If the response has no product list at results_field, which usually
+            means the field settings do not match the backend.
+    """
+    records = _field(payload, results_field)
+    if not isinstance(records, list):
+        raise ValueError(f"Search response has no product list at '{results_field}'.")
+    return [{'Product Code': _text(_field(record, code_field)),
+             'Product': _text(_field(record, description_field))}
+            for record in records if isinstance(record, dict)]
+
+def _response_payload(driver, request_id):
+    """Reads and decodes the JSON body of a finished response, or returns None."""
+    try:
+        body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+        return json.loads(text)
+    except (WebDriverException, KeyError, ValueError) as e:
+        logger.warning("Could not read search response %s: %s", request_id, e)
+        return None
+
+def capture_search(driver, product_code, timeout=30, settle=0.5):
+    """
+    Searches for a product and returns the results from the backend response instead of
+    waiting for the table to render. Typing sends a request per keystroke, and an earlier
+    prefix response may already list the code while the table is still going to re-render,
+    so the result is taken from the response to the request for the full code, once no other
+    search request is in flight. When the code is not in the request URL (e.g. a POST search),
+    the latest response is used once no request is in flight for `settle` seconds.
+    Args:
+        driver (webdriver): The Selenium WebDriver instance, started with network capture.
+        product_code (str): The code to search for.
+        timeout (int): Seconds to wait for a search response.
+        settle (float): Seconds without a newer response before the latest one is final.
+    Returns:
+        list of dict: 'Product Code' and 'Product' of each product found.
+    Raises:
+        TimeoutException: If no search response arrived in time.
+        ValueError: If the response has no product list at SEARCH_RESULTS_FIELD.
+    """
+    pattern = re.compile(SEARCH_URL_PATTERN)
+    full_code = re.compile(rf"(?<![0-9A-Za-z]){re.escape(quote(product_code, safe=''))}(?![0-9A-Za-z])")
+    # Reading the log empties it, so only requests of this search are seen below
+    driver.get_log('performance')
+    search_product(driver, product_code)
+    pending = {}
+    rows = None
+    full_code_rows = None
+    received_at = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message']).get('message', {})
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent' and pattern.search(params['request']['url']):
+                pending[params['requestId']] = params['request']['url']
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed') and params.get('requestId') in pending:
+                url = pending.pop(params['requestId'])
+                if method == 'Network.loadingFailed':
+                    continue
+                payload = _response_payload(driver, params['requestId'])
+                if payload is not None:
+                    rows = search_rows(payload)
+                    received_at = time.monotonic()
+                    if full_code.search(url):
+                        full_code_rows = rows
+        if not pending:
+            if full_code_rows is not None:
+                return full_code_rows
+            if rows is not None and time.monotonic() - received_at >= settle:
+                return rows
+        time.sleep(0.05)
+    raise TimeoutException(f"No product search response matching '{SEARCH_URL_PATTERN}' "
+                           f"within {timeout} seconds.")
@@ -0,0 +1,55 @@
+# helpers/plan.py
+'''Per-row work plan compiled once from the input so the browser loop does no pandas indexing.'''
+import math
+
+class PlanItem:
+    """
+    Everything the browser loop needs for one input row, already formatted and typed.
+    """
+    __slots__ = ('index', 'code', 'product', 'qty', 'cost_per_unit', 'total_cost',
+                 'qty_keys', 'cost_keys', 'row_hash')
+
+    def __init__(self, index, code, product, qty, cost_per_unit, total_cost, row_hash=None):
+        """
+        Args:
+            index (int): Index of the row in the input DataFrame.
+            code (str): Product code, stripped.
+            product (str): Product description, stripped.
+            qty (float): Quantity ordered.
+            cost_per_unit (float): Cost per unit.
+            total_cost (float): Expected total cost.
+            row_hash (str, optional): Hash of the row, recorded once it is entered.
+        """
+        self.index = index
+        self.code = code
+        self.product = product
+        self.qty = qty
+        self.cost_per_unit = cost_per_unit
+        self.total_cost = total_cost
+        # Keystrokes typed into the form; None when the value is missing
+        self.qty_keys = str(int(qty)) if math.isfinite(qty) else None
+        self.cost_keys = str(int(cost_per_unit)) if math.isfinite(cost_per_unit) else None
+        self.row_hash = row_hash
+
+    def __repr__(self):
+        return f"PlanItem({self.index}, {self.code!r}, {self.product!r})"
+
+def compile_plan(df, row_hashes=None):
+    """
+    Compiles the input rows into a work plan, converting each column once.
+    Args:
+        df (pd.DataFrame): The ingested rows.
+        row_hashes (list, optional): The hash of each row, from hash_rows.
+    Returns:
+        list of PlanItem: One item per row, in order, so plan[i] is the row at position i.
+    """
+    columns = (
+        df.index.tolist(),
+        df['Code'].astype(str).str.strip().tolist(),
+        df['Product'].astype(str).str.strip().tolist(),
+        df['Qty'].astype(float).tolist(),
+        df['Cost per Unit'].astype(float).tolist(),
+        df['Total Cost'].astype(float).tolist(),
+        row_hashes if row_hashes is not None else [None] * len(df),
+    )
+    return [PlanItem(*values) for values in zip(*columns)]
@@ -0,0 +1,153 @@
+# helpers/progress.py
+'''Live progress, throughput and ETA for a run, shown in the terminal and optionally over HTTP.'''
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+class ProgressTracker:
+    """
+    Tracks rows done per outcome, the rolling row rate, the ETA, the current batch
+    and how long each stage of a row takes. Safe to read from another thread.
+    """
+
+    def __init__(self, total_rows, done_rows=0, outcomes=None, rate_window=300, stage_window=50):
+        """
+        Args:
+            total_rows (int): Rows in the run.
+            done_rows (int): Rows already done before this session (e.g. when resuming).
+            outcomes (dict, optional): Outcome counts carried over from earlier sessions.
+            rate_window (int): Seconds of history used for the rows/minute rate.
+            stage_window (int): Number of recent timings kept per stage.
+        """
+        self.total_rows = total_rows
+        self.done_rows = done_rows
+        self.outcomes = dict(outcomes or {})
+        self.rate_window = rate_window
+        self.stage_window = stage_window
+        self.batch = None
+        self.num_batches = None
+        self.started = time.time()
+        self._finished_at = deque()
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def start_batch(self, batch_num, num_batches):
+        """Records the batch being processed (zero-based)."""
+        with self._lock:
+            self.batch = batch_num + 1
+            self.num_batches = num_batches
+
+    def record(self, outcome):
+        """Counts one finished row and its outcome."""
+        now = time.time()
+        with self._lock:
+            self.done_rows += 1
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            self._finished_at.append(now)
+            while self._finished_at and now - self._finished_at[0] > self.rate_window:
+                self._finished_at.popleft()
+
+    def reclassify(self, old_outcome, new_outcome):
+        """Moves one finished row from one outcome to another, e.g. when a deferred row is retried."""
+        with self._lock:
+            if self.outcomes.get(old_outcome, 0) > 0:
+                self.outcomes[old_outcome] -= 1
+                if not self.outcomes[old_outcome]:
+                    del self.outcomes[old_outcome]
+            self.outcomes[new_outcome] = self.outcomes.get(new_outcome, 0) + 1
+
+    @contextmanager
+    def stage(self, name):
+        """Times the enclosed block as one run of stage `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._stages.setdefault(name, deque(maxlen=self.stage_window)).append(elapsed)
+
+    def rows_per_minute(self):
+        """Returns the row rate over the rolling window, or since start if that is shorter."""
+        with self._lock:
+            span = min(self.rate_window, time.time() - self.started)
+            return len(self._finished_at) / span * 60 if span > 0 else 0.0
+
+    def snapshot(self):
+        """
+        Returns the current status as a JSON-serialisable dict.
+        """
+        rate = self.rows_per_minute()
+        with self._lock:
+            remaining = max(self.total_rows - self.done_rows, 0)
+            eta_seconds = remaining / rate * 60 if rate > 0 else None
+            stage_averages = {name: sum(times) / len(times) for name, times in self._stages.items() if times}
+            slowest = max(stage_averages.items(), key=lambda item: item[1]) if stage_averages else None
+            return {
+                'rows_done': self.done_rows,
+                'rows_total': self.total_rows,
+                'outcomes': dict(self.outcomes),
+                'rows_per_minute': round(rate, 2),
+                'eta_seconds': round(eta_seconds) if eta_seconds is not None else None,
+                'batch': self.batch,
+                'num_batches': self.num_batches,
+                'elapsed_seconds': round(time.time() - self.started),
+                'stage_avg_seconds': {name: round(value, 3) for name, value in stage_averages.items()},
+                'slowest_stage': {'stage': slowest[0], 'avg_seconds': round(slowest[1], 3)} if slowest else None,
+            }
+
+    def status_line(self):
+        """Formats the current status as a single terminal line."""
+        status = self.snapshot()
+        eta = status['eta_seconds']
+        eta_text = time.strftime('%H:%M:%S', time.gmtime(eta)) if eta is not None else '--:--:--'
+        outcomes = ', '.join(f"{outcome} {count}" for outcome, count in sorted(status['outcomes'].items()))
+        slowest = status['slowest_stage']
+        slowest_text = f" | slowest: {slowest['stage']} {slowest['avg_seconds']:.1f}s" if slowest else ''
+        return (f"Row {status['rows_done']}/{status['rows_total']} | batch {status['batch']}/{status['num_batches']}"
+                f" | {status['rows_per_minute']:.1f} rows/min | ETA {eta_text} | {outcomes}{slowest_text}")
+
+    def render(self, stream=None):
+        """Redraws the status line in place on the terminal."""
+        stream = stream or sys.stderr
+        stream.write(f"\r\x1b[K{self.status_line()}")
+        stream.flush()
+
+def serve_status(tracker, port, host='127.0.0.1'):
+    """
+    Serves the tracker snapshot as JSON on http://host:port/ from a background thread.
+    Args:
+        tracker (ProgressTracker): The tracker to report.
+        port (int): Port to listen on.
+        host (str): Interface to bind; local only by default.
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() when the run ends.
+    """
+    class StatusHandler(BaseHTTPRequestHandler):
+        '''Answers every GET with the current status.'''
+
+        def do_GET(self):
+            body = json.dumps(tracker.snapshot()).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("Status request: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, name='status-server', daemon=True)
+    thread.start()
+    logger.info("Status available at http://%s:%s/", host, server.server_address[1])
+    print(f"Live status: http://{host}:{server.server_address[1]}/")
+    return server
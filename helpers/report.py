@@ -0,0 +1,170 @@
+# helpers/report.py
+'''Functions to build the final output workbook in a single pass.'''
+import csv
+import json
+import logging
+import math
+import os
+from datetime import datetime
+import xlsxwriter
+from helpers.transfer import ERROR_COLUMNS
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+# Error journal columns written to the report as numbers so they can be filtered and summed.
+NUMERIC_ERROR_COLUMNS = {'Batch', 'Index', 'Qty', 'Cost per Unit', 'Total Cost', 'Web_Difference'}
+
+def new_run_summary():
+    """
+    Creates an empty run summary.
+    Returns:
+        dict: Outcome counts, processed rows and time spent across every session of the run.
+    """
+    return {
+        'outcomes': {},
+        'rows_processed': 0,
+        'duration_seconds': 0.0,
+        'first_started': datetime.now().isoformat(timespec='seconds'),
+        'last_finished': None,
+        'removed_codes': [],
+        'deferred_rows': [],
+        # Incremental runs keep no batch checkpoint; resume diffs the input again instead
+        'incremental': False,
+        # Where the rows came from, so 'report' rebuilds the same Input Data sheet
+        'input': None,
+    }
+
+def load_run_summary(filepath):
+    """
+    Loads the run summary written by a previous session, or starts a new one.
+    """
+    if not os.path.exists(filepath):
+        return new_run_summary()
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        # Summaries written before retry passes existed have no deferred rows
+        summary.setdefault('deferred_rows', [])
+        return summary
+    except (OSError, ValueError) as e:
+        logger.error("Failed to read run summary from '%s': %s", filepath, e, exc_info=True)
+        return new_run_summary()
+
+def save_run_summary(summary, filepath):
+    """
+    Writes the run summary so a resumed run keeps counting from where it stopped.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+
+def record_outcome(summary, outcome):
+    """
+    Counts the outcome of one processed row.
+    """
+    outcomes = summary['outcomes']
+    outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    summary['rows_processed'] += 1
+
+def summary_rows(summary):
+    """
+    Flattens the run summary into (Metric, Value) rows for the 'Run Summary' sheet.
+    """
+    duration = summary['duration_seconds']
+    rows_processed = summary['rows_processed']
+    throughput = rows_processed / (duration / 60) if duration > 0 else 0.0
+    rows = [('Rows processed', rows_processed)]
+    rows.extend((f"Rows: {outcome}", count) for outcome, count in sorted(summary['outcomes'].items()))
+    if summary.get('deferred_rows'):
+        # Only left over when the run stopped before its retry passes finished
+        rows.append(('Rows awaiting retry', len(summary['deferred_rows'])))
+    rows.extend([
+        ('Duration (minutes)', round(duration / 60, 2)),
+        ('Throughput (rows/minute)', round(throughput, 2)),
+        ('First started', summary['first_started']),
+        ('Last finished', summary['last_finished'] or ''),
+    ])
+    return rows
+
+def _cell(value):
+    """Converts missing values to None so they are written as blank cells."""
+    if value is None:
+        return None
+    try:
+        if value != value or (isinstance(value, float) and math.isinf(value)):
+            return None
+    except (TypeError, ValueError):
+        return None
+    return value
+
+def _error_cell(column, value):
+    """Converts an error journal value back to a number where the column is numeric."""
+    if value == '':
+        return None
+    if column in NUMERIC_ERROR_COLUMNS:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+def _write_frame(workbook, sheet_name, df, header_format):
+    """Streams a DataFrame into a new sheet one row at a time."""
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+    for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_num, 0, [_cell(value) for value in row])
+    worksheet.freeze_panes(1, 0)
+    return worksheet
+
+def _write_errors(workbook, errors_journal_path, header_format):
+    """Streams the error journal into a single filterable 'Errors' sheet."""
+    worksheet = workbook.add_worksheet('Errors')
+    worksheet.write_row(0, 0, ERROR_COLUMNS, header_format)
+    last_row = 0
+    if os.path.exists(errors_journal_path):
+        with open(errors_journal_path, 'r', encoding='utf-8', newline='') as f:
+            for record in csv.DictReader(f):
+                last_row += 1
+                worksheet.write_row(last_row, 0, [_error_cell(column, record.get(column, ''))
+                                                  for column in ERROR_COLUMNS])
+    worksheet.autofilter(0, 0, last_row, len(ERROR_COLUMNS) - 1)
+    worksheet.freeze_panes(1, 0)
+    return last_row
+
+def write_report(filepath, input_df, errors_journal_path, summary, removed_df=None):
+    """
+    Writes the output workbook once, streaming every sheet in constant-memory mode.
+    Args:
+        filepath (str): Path of the output workbook.
+        input_df (pd.DataFrame): The rows the run was given.
+        errors_journal_path (str): Path of the CSV error journal written by save_errors.
+        summary (dict): The run summary from load_run_summary.
+        removed_df (pd.DataFrame, optional): Lines removed since the previous submission.
+    Returns:
+        bool: True if the workbook was written, False otherwise.
+    """
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+        header_format = workbook.add_format({'bold': True})
+        _write_frame(workbook, 'Input Data', input_df, header_format)
+        error_count = _write_errors(workbook, errors_journal_path, header_format)
+        summary_sheet = workbook.add_worksheet('Run Summary')
+        summary_sheet.write_row(0, 0, ['Metric', 'Value'], header_format)
+        for row_num, row in enumerate(summary_rows(summary), start=1):
+            summary_sheet.write_row(row_num, 0, row)
+        if removed_df is not None and not removed_df.empty:
+            _write_frame(workbook, 'Removed Lines', removed_df, header_format)
+        workbook.close()
+        logger.info("Report with %s errors saved to '%s'.", error_count, filepath)
+        print(f"Report saved to {filepath}")
+        return True
+    except Exception as e:
+        logger.error("Failed to write the report to '%s': %s", filepath, e, exc_info=True)
+        return False
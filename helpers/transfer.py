@@ -1,7 +1,7 @@
 # helpers/utilities.py
 '''Transfer functions'''
 import logging
-# import os
+import os
 # from dataclasses import dataclass, asdict
 # from typing import Optional, Any
 import pandas as pd
@@ -11,6 +11,16 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 logger.propagate = False
 
+# Columns of the error journal and of the 'Errors' sheet in the final report.
+ERROR_COLUMNS = ['Batch', 'Index', 'Error Type', 'Error Message', 'Code', 'Product', 'Qty',
+                 'Cost per Unit', 'Total Cost', 'Web_Difference']
+
+def new_errors_df():
+    """
+    Creates an empty errors DataFrame for one batch.
+    """
+    return pd.DataFrame(columns=ERROR_COLUMNS[1:])
+
 # This returns an object, but we are working with a mutable object, so we need to convert it to a dictionary.
 # def log_error(errors_df, row_index, input_file, error_type, error_message, error_details=None):
 #     """
@@ -97,24 +107,64 @@ def log_error(errors_df, row_index, input_file, error_type, error_message, error
     errors_df.loc[len(errors_df)] = new_error
     logger.info("Error logged: %s", new_error)
 
-# This uses openpyxl to append the errors_df to the existing Excel file instead of xlsx writer.
-def save_errors(errors_df, filepath, batch_num):
+def log_item_error(errors, item, error_type, error_message, error_details=None):
+    """
+    Logs an error for a work plan item.
+    Same record as log_error, but the row values come from the item and the record is
+    appended to a plain list, so the browser loop does no DataFrame indexing.
+    Args:
+        errors (list): The error records of the batch, saved with save_errors.
+        item (PlanItem): The row where the error occurred.
+        error_type (str): The type of error.
+        error_message (str): A detailed error message.
+        error_details (dict, optional): Additional error details.
+    """
+    new_error = {
+        "Index": item.index,
+        "Error Type": error_type,
+        "Error Message": error_message,
+        "Code": item.code,
+        "Product": item.product,
+        "Qty": item.qty,
+        "Cost per Unit": item.cost_per_unit,
+        "Total Cost": item.total_cost
+    }
+    if error_details:
+        new_error.update(error_details)
+    errors.append(new_error)
+    logger.info("Error logged: %s", new_error)
+
+# Errors are appended to a CSV journal; the workbook is written once by helpers.report at the end.
+def save_errors(errors_df, filepath, batch_num, raise_errors=False):
     """
-    Saves the errors DataFrame to a new sheet in the Excel file.
+    Appends the errors DataFrame of a batch to the error journal.
+    Args:
+        errors_df (pd.DataFrame or list): The errors recorded for the batch, as a DataFrame
+            or as the list of records from log_item_error.
+        filepath (str): Path of the CSV error journal.
+        batch_num (int): The zero-based batch number, or -1 for errors found before the first batch.
+        raise_errors (bool): Re-raise a failed write after logging it, so a BackgroundWriter
+            knows the batch's errors are not on disk.
     """
     try:
-        print(f"Saving errors to: {filepath}")
-        errors_sheet_name = f'Errors Batch {batch_num + 1}'
+        if isinstance(errors_df, list):
+            errors_df = pd.DataFrame(errors_df, columns=ERROR_COLUMNS[1:])
         if not errors_df.empty:
-            # Append the errors_df to the existing Excel file
-            with pd.ExcelWriter(filepath, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-                errors_df.to_excel(writer, sheet_name=errors_sheet_name, index=False)
-            logger.info("Errors DataFrame saved to '%s' successfully.", filepath)
+            journal_df = errors_df.assign(Batch=batch_num + 1).reindex(columns=ERROR_COLUMNS)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            write_header = not os.path.exists(filepath)
+            with open(filepath, 'a', encoding='utf-8', newline='') as f:
+                journal_df.to_csv(f, header=write_header, index=False)
+                f.flush()
+                os.fsync(f.fileno())
+            logger.info("Errors for batch %s appended to '%s'.", batch_num + 1, filepath)
         else:
             print(f"No errors to save for batch {batch_num + 1}")
 
     except Exception as e:
-        logger.error("Failed to save the Errors DataFrame to an Excel file: %s", e, exc_info=True)
+        logger.error("Failed to append the Errors DataFrame to the journal: %s", e, exc_info=True)
+        if raise_errors:
+            raise
 
 # def save_errors(errors_df, filepath, input_file):
 #     """
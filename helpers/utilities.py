@@ -11,7 +11,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (NoSuchElementException, TimeoutException, WebDriverException,
                                         ElementClickInterceptedException, StaleElementReferenceException)
-from config import BROWSER, DRIVER_PATH
+from config import BROWSER, DRIVER_PATH, NETWORK_CAPTURE
+from helpers.network import enable_network_capture, start_network_capture
 
 logger = logging.getLogger(__name__)
 logger.propagate = False
@@ -26,8 +27,12 @@ def initialize_driver():
         if BROWSER.lower() == "edge":
             options = Options()
             options.use_chromium = True
+            if NETWORK_CAPTURE:
+                enable_network_capture(options)
             service = Service(executable_path=DRIVER_PATH)
             driver = webdriver.Edge(service=service, options=options)
+            if NETWORK_CAPTURE:
+                start_network_capture(driver)
             driver.maximize_window()
             logger.info("Edge WebDriver initialized and window maximized.")
             return driver
@@ -0,0 +1,128 @@
+# helpers/watchdog.py
+'''Browser health watchdog that recycles the WebDriver when a long run starts to degrade.'''
+import logging
+import statistics
+from collections import deque
+from helpers.login import start_session
+from helpers.utilities import initialize_driver, close_driver, save_form
+try:
+    import psutil
+except ImportError:  # psutil is optional; without it only latency and row count trigger a recycle
+    psutil = None
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+class BrowserWatchdog:
+    """
+    Tracks per-row latency and browser memory for the current driver session and
+    decides when the driver should be recycled. A threshold of 0 disables that check.
+    """
+
+    def __init__(self, recycle_every=0, latency_factor=0.0, rss_limit_mb=0, window=50, rss_check_every=10):
+        """
+        Args:
+            recycle_every (int): Recycle after this many rows in one session.
+            latency_factor (float): Recycle when the median latency of the last `window` rows
+                exceeds the median of the first `window` rows of the session by this factor.
+            rss_limit_mb (int): Recycle when the driver and its browser processes use more memory.
+            window (int): Number of rows in the baseline and recent latency windows.
+            rss_check_every (int): Rows between memory checks.
+        """
+        self.recycle_every = recycle_every
+        self.latency_factor = latency_factor
+        self.rss_limit_mb = rss_limit_mb
+        self.window = window
+        self.rss_check_every = rss_check_every
+        self.driver = None
+        self.rows = 0
+        self.entered = 0
+        self.recycles = 0
+        self._baseline = []
+        self._recent = deque(maxlen=window)
+        self._last_rss_mb = None
+
+    def attach(self, driver):
+        """Starts watching a new driver session."""
+        self.driver = driver
+        self.rows = 0
+        self.entered = 0
+        self._baseline = []
+        self._recent.clear()
+        self._last_rss_mb = None
+
+    def record_row(self, seconds, outcome):
+        """Records how long a row took and its outcome."""
+        self.rows += 1
+        if outcome == "Entered":
+            self.entered += 1
+        if len(self._baseline) < self.window:
+            self._baseline.append(seconds)
+        self._recent.append(seconds)
+        if self.rss_limit_mb and self.rows % self.rss_check_every == 0:
+            self._last_rss_mb = self.browser_rss_mb()
+
+    def browser_rss_mb(self):
+        """
+        Returns the resident memory of the driver service and all browser processes it started,
+        or None when psutil is not installed or the process is gone.
+        """
+        if psutil is None or self.driver is None:
+            return None
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            total = 0
+            for child in processes:
+                try:
+                    total += child.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return total / (1024 * 1024)
+        except (AttributeError, psutil.Error) as e:
+            logger.warning("Could not read browser memory: %s", e)
+            return None
+
+    def recycle_reason(self):
+        """
+        Returns why the driver should be recycled now, or None if it is healthy.
+        """
+        if self.recycle_every and self.rows >= self.recycle_every:
+            return f"{self.rows} rows processed in this session"
+        if self.latency_factor and len(self._baseline) >= self.window and len(self._recent) >= self.window:
+            baseline = statistics.median(self._baseline)
+            recent = statistics.median(self._recent)
+            if baseline > 0 and recent > baseline * self.latency_factor:
+                return f"row latency rose from {baseline:.1f}s to {recent:.1f}s"
+        if self.rss_limit_mb and self._last_rss_mb and self._last_rss_mb > self.rss_limit_mb:
+            return f"browser memory at {self._last_rss_mb:.0f} MB"
+        return None
+
+def recycle_driver(driver, watchdog, reason):
+    """
+    Replaces the driver with a fresh, logged-in session on a new carryout form.
+    The current form is saved first if any line was entered on it.
+    Args:
+        driver (webdriver): The current Selenium WebDriver instance.
+        watchdog (BrowserWatchdog): The watchdog to attach to the new driver.
+        reason (str): Why the driver is recycled, for the log.
+    Returns:
+        webdriver: The new WebDriver instance.
+    """
+    logger.warning("Recycling the browser: %s.", reason)
+    print(f"\nRecycling the browser: {reason}.")
+    if watchdog.entered:
+        save_form(driver)
+    try:
+        close_driver(driver)
+    except Exception:
+        # A wedged browser must not stop the run; the new session replaces it
+        logger.warning("Closing the old WebDriver failed; continuing with a new one.")
+    new_driver = initialize_driver()
+    if new_driver is None:
+        raise RuntimeError("Failed to start a new WebDriver while recycling.")
+    start_session(new_driver)
+    watchdog.attach(new_driver)
+    watchdog.recycles += 1
+    logger.info("Browser recycled (%s so far).", watchdog.recycles)
+    return new_driver
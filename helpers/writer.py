@@ -0,0 +1,108 @@
+# helpers/writer.py
+'''Background writer that keeps checkpoint and journal writes off the browser thread.'''
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+class BackgroundWriter:
+    """
+    Runs persistence jobs one at a time, in the order they were submitted, on a single
+    background thread. At most `max_pending` jobs wait in the queue; submitting beyond
+    that blocks until the writer catches up, so a stalled disk cannot grow memory without limit.
+    Jobs must not share mutable state with the caller; pass copies of anything that keeps changing.
+    A job submitted with only_if_clean=True (e.g. the checkpoint) is skipped once any earlier job
+    has failed, so it never records progress whose records did not reach the disk.
+    """
+
+    def __init__(self, max_pending=16, name='writer'):
+        """
+        Args:
+            max_pending (int): Maximum number of queued jobs.
+            name (str): Name of the writer thread, for the log.
+        """
+        self.failures = 0
+        self.skipped = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args, only_if_clean=False, **kwargs):
+        """
+        Queues func(*args, **kwargs) to run after every job submitted before it.
+        With only_if_clean, the job is skipped if any job before it failed.
+        """
+        if self._closed:
+            raise RuntimeError("The background writer is closed.")
+        self._queue.put((func, args, kwargs, only_if_clean))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                func, args, kwargs, only_if_clean = job
+                if only_if_clean and self.failures:
+                    self.skipped += 1
+                    logger.error("Skipped background write %s after an earlier write failed.",
+                                 getattr(func, '__name__', func))
+                    continue
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    # A failed write is logged and the following jobs still run
+                    self.failures += 1
+                    logger.error("Background write %s failed: %s", getattr(func, '__name__', func), e,
+                                 exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Waits until every job submitted so far has run."""
+        self._queue.join()
+
+    def close(self, timeout=None):
+        """
+        Runs the remaining jobs and stops the writer thread. Safe to call more than once.
+        Args:
+            timeout (float, optional): Seconds to wait for the queue to drain.
+        Returns:
+            bool: True if every queued job ran.
+        """
+        first_close = not self._closed
+        if first_close:
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error("The background writer did not finish within %s seconds.", timeout)
+            return False
+        if first_close and self.failures:
+            logger.warning("%s background writes failed and %s were skipped; see the errors above.",
+                           self.failures, self.skipped)
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+def write_checkpoint(filepath, next_batch_num):
+    """
+    Records the next batch to process, replacing the checkpoint file in one step.
+    The new file is flushed to disk before it replaces the old one, so a crash leaves
+    either the previous checkpoint or the new one.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(str(next_batch_num))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
@@ -1,49 +1,87 @@
 # Code/main.py
 '''Main script to execute the Selenium automation workflow.'''
+import copy
 import traceback
 import os
 import sys
 import logging
 import math
-import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from excel_to_dataframe import unique_df
-from config import CHECKPOINT_PATH, OUTPUT_XLSX_PATH
+import time
+from datetime import datetime
+from excel_to_dataframe import load_input
+from config import (CHECKPOINT_PATH, OUTPUT_XLSX_PATH, SUBMITTED_ROWS_PATH,
+                    ERRORS_JOURNAL_PATH, RUN_SUMMARY_PATH, CATALOG_SNAPSHOT_PATH, STATUS_PORT,
+                    RECYCLE_EVERY_ROWS, RECYCLE_LATENCY_FACTOR, RECYCLE_RSS_LIMIT_MB, WATCHDOG_WINDOW,
+                    RETRY_PASSES, RETRY_FRESH_DRIVER, NETWORK_CAPTURE, HTTP_LOOKUP, HTTP_SEARCH_URL)
 from logging_config import setup_logging
 from helpers import (
     initialize_driver,
-    login_sequence,
-    click_got_it_button,
-    select_business,
-    select_delivery,
-    select_carryout,
-    set_up,
+    start_session,
     save_errors,
+    search_product,
+    wait_for_first_result,
     extract_all_cells,
-    fill_fields,
+    capture_search,
+    new_lookup_client,
+    update_cookies,
+    lookup_products,
+    SEARCH_TABLE_XPATH,
+    fill_and_read_total,
     close_form,
-    get_total_costs,
     log_error,
-    save_form
+    log_item_error,
+    compile_plan,
+    save_form,
+    hash_rows,
+    load_submitted,
+    save_submitted,
+    diff_against_submitted,
+    removed_rows,
+    new_errors_df,
+    new_run_summary,
+    load_run_summary,
+    save_run_summary,
+    record_outcome,
+    write_report,
+    check_against_catalog,
+    snapshot_synced_at,
+    ProgressTracker,
+    serve_status,
+    BrowserWatchdog,
+    recycle_driver,
+    BackgroundWriter,
+    write_checkpoint
 )
-setup_logging()
 logger = logging.getLogger(__name__)
 
-def loop(driver, input_file, data_row_index, errors_df):
-    '''Loops through the DataFrame and processes each row.'''
+def loop(driver, item, errors, tracker, search_results=None):
+    '''Processes one row of the work plan.
+    Each stage is timed on the progress tracker and errors are appended to the `errors` list.
+    search_results holds the rows of an HTTP lookup done beforehand; the browser then only
+    opens the product for entry, and products the lookup did not find never open the modal.
+    Returns the outcome of the row: 'Entered' or the type of error that was logged.
+    An exception once the line entry has started is an 'Entry Error' rather than a 'Processing Error':
+    the line may already be on the form, so it is reported for checking instead of being retried.'''
+    filling = False
     try:
-        search_button = WebDriverWait(driver, 20).until(EC.element_to_be_clickable((By.ID, "web-md-button-189fl7lckkbbqvmi")))
-        driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-        driver.execute_script("document.querySelectorAll('.md-scroll-mask').forEach(e => e.remove());")
-        driver.execute_script("arguments[0].click();", search_button)
-        search_textbox = WebDriverWait(driver, 20).until(EC.visibility_of_element_located((By.ID, "web-input-189fl7nukkbbymu9")))
-        search_textbox.clear()
-        product_code = str(input_file.loc[data_row_index, "Code"]).strip()
-        product_description = str(input_file.loc[data_row_index, "Product"]).strip()
-        search_textbox.send_keys(product_code)
-        all_cell_data = extract_all_cells(driver, table_xpath=".//table[contains(@id, 'web-table')]", timeout=30)
+        product_code = item.code
+        product_description = item.product
+        if search_results is not None:
+            all_cell_data = search_results
+        else:
+            with tracker.stage("search"):
+                if NETWORK_CAPTURE:
+                    # The backend response is matched as soon as it lands; the fill below still waits
+                    # for the table to show the product
+                    try:
+                        all_cell_data = capture_search(driver, product_code, timeout=30)
+                    except ValueError as e:
+                        # Usually wrong [network_capture] field settings; the search is already typed
+                        logger.warning("%s Reading the search table instead.", e)
+                        all_cell_data = extract_all_cells(driver, table_xpath=SEARCH_TABLE_XPATH, timeout=30)
+                else:
+                    search_product(driver, product_code)
+                    all_cell_data = extract_all_cells(driver, table_xpath=SEARCH_TABLE_XPATH, timeout=30)
         
         # Check if the product is found in the web table
         matching_row = None
@@ -54,142 +92,360 @@ def loop(driver, input_file, data_row_index, errors_df):
                 break
         if matching_row is None:
             error_message = f"Product code {product_code} with description '{product_description}' not found in the web table."
-            error_details = {'Code': product_code, 'Product': product_description}
-            log_error(
-                errors_df,
-                row_index=data_row_index,
-                input_file=input_file,
+            log_item_error(
+                errors,
+                item,
                 error_type="Product Not Found",
-                error_message=error_message,
-                error_details=error_details
+                error_message=error_message
             )
             print(error_message)
-            close_form(driver)
-            return
-        fill_data = input_file.loc[data_row_index]
-        fill_fields(driver, fill_data)
-        total_cost_df, total_cost_web = get_total_costs(driver, input_file, data_row_index)
+            if search_results is None:
+                with tracker.stage("close"):
+                    close_form(driver)
+            return "Product Not Found"
+        if search_results is not None:
+            with tracker.stage("search"):
+                search_product(driver, product_code)
+        with tracker.stage("search"):
+            # The lookup result and the search table can be ahead of what the modal shows
+            wait_for_first_result(driver, product_code, timeout=30)
+        total_cost_df = item.total_cost
+        filling = True
+        with tracker.stage("fill"):
+            total_cost_web = fill_and_read_total(driver, item)
         difference = total_cost_web - total_cost_df
-        print(f"Total Cost DF: {total_cost_df}")
-        print(f"Total Cost Web: {total_cost_web}")
-        print(f"The difference between total costs is: {difference}")
+        # Kept out of the console so the live status line stays on one line
+        logger.debug("Total Cost DF: %s, Total Cost Web: %s, difference: %s",
+                     total_cost_df, total_cost_web, difference)
         if not math.isclose(total_cost_df, total_cost_web, rel_tol=1e-4):
             error_message = "Expected total cost does not match web total cost."
-            error_details = {
-                'Qty': float(fill_data["Qty"]),
-                'Cost per Unit': float(fill_data["Cost per Unit"]),
-                'Total Cost': float(fill_data["Total Cost"]),
-                'Web_Difference': difference
-            }
-            log_error(
-                errors_df,
-                row_index=data_row_index,
-                input_file=input_file,
+            error_details = {'Web_Difference': difference}
+            log_item_error(
+                errors,
+                item,
                 error_type="Total Cost Mismatch",
                 error_message=error_message,
                 error_details=error_details
             )
             print(f"Error logged: {error_message}")
+            with tracker.stage("close"):
+                close_form(driver)
+            return "Total Cost Mismatch"
+        logger.debug("The totals match for DataFrame row: '%s'", item.index + 1)
+        with tracker.stage("close"):
             close_form(driver)
-            return
-        print(f"The totals match for DataFrame row: '{data_row_index + 1}'")
-        close_form(driver)
+        return "Entered"
     except Exception as e:
         traceback.print_exc()
-        logger.error("An error occurred at row %s: %s", data_row_index, str(e))
+        logger.error("An error occurred at row %s: %s", item.index, str(e))
         error_message = str(e)
         traceback_str = traceback.format_exc()
-        log_error(
-            errors_df,
-            row_index=data_row_index,
-            input_file=input_file,
+        error_type = "Entry Error" if filling else "Processing Error"
+        log_item_error(
+            errors,
+            item,
+            error_type=error_type,
+            error_message=error_message,
+            error_details={'Traceback': traceback_str}
+        )
+        try:
+            with tracker.stage("close"):
+                close_form(driver)
+        except Exception as close_error:
+            # The row is already logged; letting this escape would turn an Entry Error into a retry
+            logger.error("Could not close the modal after the error at row %s: %s", item.index, close_error)
+        return error_type
+
+def process_row(driver, item, errors, tracker, search_results=None):
+    """
+    Runs loop for one work plan item and logs anything that escapes it as a processing error.
+    Returns:
+        str: The outcome of the row.
+    """
+    try:
+        return loop(driver, item, errors, tracker, search_results)
+    except Exception as e:
+        error_message = str(e)
+        traceback_str = traceback.format_exc()
+        log_item_error(
+            errors,
+            item,
             error_type="Processing Error",
             error_message=error_message,
             error_details={'Traceback': traceback_str}
         )
-        close_form(driver)
-        return
+        return "Processing Error"
 
-def main(file, reset_checkpoint=False):
+def retry_deferred(driver, plan, summary, tracker, watchdog, writer, submitted, passes, fresh_driver,
+                   first_batch_num):
+    """
+    Retries the rows deferred after a processing error, up to `passes` times.
+    Only rows that still fail on the last pass are logged to the error journal; each pass
+    is saved to the journal as its own batch, numbered after the main pass.
+    Args:
+        driver (webdriver): The current Selenium WebDriver instance.
+        plan (list of PlanItem): The work plan of the run.
+        summary (dict): The run summary holding the plan positions of the deferred rows.
+        tracker (ProgressTracker): Progress of the run.
+        watchdog (BrowserWatchdog): Watchdog of the current driver.
+        writer (BackgroundWriter): Writer that saves the journal, submitted rows and summary.
+        submitted (dict): Submitted row hashes by product code.
+        passes (int): Number of retry passes.
+        fresh_driver (bool): Start each pass on a newly initialized driver.
+        first_batch_num (int): Journal batch number of the first pass.
+    Returns:
+        webdriver: The driver in use after the retries.
+    """
+    for pass_num in range(passes):
+        deferred = summary['deferred_rows']
+        if not deferred:
+            break
+        last_pass = pass_num == passes - 1
+        print(f"\nRetry pass {pass_num + 1}/{passes}: {len(deferred)} rows.")
+        if fresh_driver:
+            driver = recycle_driver(driver, watchdog, f"retry pass {pass_num + 1}")
+        errors = []
+        still_failing = []
+        for position in deferred:
+            row_started = time.perf_counter()
+            errors_before = len(errors)
+            item = plan[position]
+            outcome = process_row(driver, item, errors, tracker)
+            watchdog.record_row(time.perf_counter() - row_started, outcome)
+            if outcome == "Processing Error" and not last_pass:
+                del errors[errors_before:]
+                still_failing.append(position)
+            else:
+                if outcome == "Entered":
+                    submitted[item.code] = item.row_hash
+                record_outcome(summary, outcome)
+                tracker.reclassify("Deferred", outcome)
+            tracker.render()
+            reason = watchdog.recycle_reason()
+            if reason:
+                driver = recycle_driver(driver, watchdog, reason)
+        summary['deferred_rows'] = still_failing
+        with tracker.stage("save"):
+            writer.submit(save_errors, errors, ERRORS_JOURNAL_PATH, first_batch_num + pass_num, raise_errors=True)
+            writer.submit(save_submitted, dict(submitted), SUBMITTED_ROWS_PATH)
+            writer.submit(save_run_summary, copy.deepcopy(summary), RUN_SUMMARY_PATH)
+        logger.info("Retry pass %s recovered %s of %s rows.", pass_num + 1,
+                    len(deferred) - len(still_failing), len(deferred))
+    return driver
+
+def skip_unknown_products(file, errors_df):
+    """
+    Checks the input against the catalog snapshot and drops rows the supplier does not list.
+    The dropped rows are logged as 'Product Not Found' errors with their index in `file`.
+    Returns:
+        pd.DataFrame: The remaining rows. They keep their index in `file`, so errors logged
+            for them later still point at the right row of the report.
+    """
+    unknown_df = check_against_catalog(file, CATALOG_SNAPSHOT_PATH)
+    if unknown_df.empty:
+        return file
+    synced_at = snapshot_synced_at(CATALOG_SNAPSHOT_PATH)
+    for row_index, reason in unknown_df['Reason'].items():
+        log_error(
+            errors_df,
+            row_index=row_index,
+            input_file=file,
+            error_type="Product Not Found",
+            error_message=f"{reason} (snapshot taken {synced_at}).",
+        )
+    print(f"{len(unknown_df)} rows are not in the catalog snapshot and will be skipped.")
+    return file.drop(index=unknown_df.index)
+
+def main(file, reset_checkpoint=False, incremental=False, prune_removed=False, catalog_check=True,
+         status_port=STATUS_PORT, retry_passes=RETRY_PASSES, retry_fresh_driver=RETRY_FRESH_DRIVER,
+         http_lookup=HTTP_LOOKUP, input_source=None):
     """
     Main function to execute the Selenium automation workflow.
     Processes the DataFrame in batches, with checkpointing.
+    In incremental mode only rows added or changed since the previous submission are processed,
+    and no batch checkpoint is written: running it again picks up the rows not yet entered.
+    With catalog_check, rows missing from the catalog snapshot are reported and skipped up front.
+    Progress is shown on a live status line, and as JSON on localhost:status_port when it is set.
+    Rows that fail with a processing error before their line entry started are deferred and
+    retried after the main pass, up to retry_passes times; only rows that still fail are reported.
+    With http_lookup, each batch's products are searched concurrently over HTTP with the
+    browser's session cookies, and the browser is only used to enter the lines.
+    input_source is recorded in the run summary so the report can be rebuilt from the same input.
+    Returns:
+        bool: True if every batch and the retry pass finished and every write reached the disk,
+            False if the run stopped early and should be resumed from the checkpoint.
     """
+    # The report lists the whole input; error indexes refer to its rows
+    input_df = file
+    submitted = load_submitted(SUBMITTED_ROWS_PATH)
+    removed_codes = []
+    if incremental:
+        file, removed_codes = diff_against_submitted(file, submitted)
+        if prune_removed:
+            for code in removed_codes:
+                submitted.pop(code, None)
+        # The submitted rows store already tracks progress, so the batch checkpoint starts over.
+        reset_checkpoint = True
+        if file.empty:
+            if prune_removed:
+                save_submitted(submitted, SUBMITTED_ROWS_PATH)
+            print("No added or changed rows to process.")
+            return True
+    elif reset_checkpoint or not os.path.exists(CHECKPOINT_PATH):
+        # A full run from the first batch replaces the previous submission.
+        submitted = {}
     if reset_checkpoint and os.path.exists(CHECKPOINT_PATH):
         os.remove(CHECKPOINT_PATH)
         print("Checkpoint has been reset. Starting from the first batch.")
+    if os.path.exists(CHECKPOINT_PATH):
+        with open(CHECKPOINT_PATH, 'r', encoding="utf-8") as f:
+            checkpoint_data = f.read().strip()
+            if checkpoint_data.isdigit():
+                last_processed_batch_num = int(checkpoint_data)
+                print(f"Resuming from batch number {last_processed_batch_num}")
+            else:
+                last_processed_batch_num = 0
+    else:
+        last_processed_batch_num = 0
+    # Starting fresh clears the error journal and run summary of the previous run
+    if last_processed_batch_num == 0:
+        if os.path.exists(ERRORS_JOURNAL_PATH):
+            os.remove(ERRORS_JOURNAL_PATH)
+        summary = new_run_summary()
+        summary['removed_codes'] = removed_codes
+        summary['incremental'] = incremental
+        summary['input'] = input_source
+    else:
+        summary = load_run_summary(RUN_SUMMARY_PATH)
+    if catalog_check and os.path.exists(CATALOG_SNAPSHOT_PATH):
+        precheck_errors_df = new_errors_df()
+        file = skip_unknown_products(file, precheck_errors_df)
+        # Resumed runs skip the same rows but their errors are already in the journal
+        if last_processed_batch_num == 0:
+            save_errors(precheck_errors_df, ERRORS_JOURNAL_PATH, batch_num=-1)
+            for _ in range(len(precheck_errors_df)):
+                record_outcome(summary, "Product Not Found")
+        if file.empty:
+            save_run_summary(summary, RUN_SUMMARY_PATH)
+            write_report(OUTPUT_XLSX_PATH, input_df, ERRORS_JOURNAL_PATH, summary,
+                         removed_df=removed_rows(summary['removed_codes']))
+            print("No rows left to process after the catalog check.")
+            return True
+    # Rows are converted once here so the browser loop does no DataFrame lookups
+    plan = compile_plan(file, hash_rows(file))
+    batch_size = 50
+    total_rows = file.shape[0]
+    num_batches = (total_rows + batch_size - 1) // batch_size
+    # Rows deferred in earlier sessions are done but have no final outcome yet
+    outcomes = dict(summary['outcomes'])
+    if summary['deferred_rows']:
+        outcomes["Deferred"] = len(summary['deferred_rows'])
+    tracker = ProgressTracker(total_rows, done_rows=min(last_processed_batch_num * batch_size, total_rows),
+                              outcomes=outcomes)
+    status_server = serve_status(tracker, status_port) if status_port else None
     driver = initialize_driver()
+    watchdog = BrowserWatchdog(recycle_every=RECYCLE_EVERY_ROWS, latency_factor=RECYCLE_LATENCY_FACTOR,
+                               rss_limit_mb=RECYCLE_RSS_LIMIT_MB, window=WATCHDOG_WINDOW)
+    watchdog.attach(driver)
+    # Saving happens on the writer thread so the browser never waits on the disk
+    writer = BackgroundWriter()
     logger.info("Application started.")
+    last_tick = time.perf_counter()
+    completed = False
 
     try:
-        if os.path.exists(CHECKPOINT_PATH):
-            with open(CHECKPOINT_PATH, 'r', encoding="utf-8") as f:
-                checkpoint_data = f.read().strip()
-                if checkpoint_data.isdigit():
-                    last_processed_batch_num = int(checkpoint_data)
-                    print(f"Resuming from batch number {last_processed_batch_num}")
-                else:
-                    last_processed_batch_num = 0
-        else:
-            last_processed_batch_num = 0
-
-        login_sequence(driver)
-        click_got_it_button(driver)
-        select_business(driver)
-        select_delivery(driver)
-        select_carryout(driver)
-        set_up(driver)
-        batch_size = 50
-        total_rows = file.shape[0]
-        num_batches = (total_rows + batch_size - 1) // batch_size
-        output_filepath = OUTPUT_XLSX_PATH
-        # At the start, write the 'Input Data' sheet to the Excel file if starting fresh
-        if last_processed_batch_num == 0:
-            os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
-            with pd.ExcelWriter(output_filepath, engine='openpyxl') as writer:
-                file.to_excel(writer, sheet_name='Input Data', index=False)
-            print(f"Input data saved to {output_filepath}")
+        start_session(driver)
+        lookup_client = new_lookup_client(driver) if http_lookup and HTTP_SEARCH_URL else None
+        if http_lookup and lookup_client is None:
+            logger.warning("HTTP lookup is enabled but no search_url is set; searching in the browser.")
 
         for batch_num in range(last_processed_batch_num, num_batches):
             start_index = batch_num * batch_size
             end_index = min(start_index + batch_size, total_rows)
-            batch_df = file.iloc[start_index:end_index].reset_index(drop=True)
-            errors_df = pd.DataFrame(columns=[
-                'Index', 'Error Type', 'Error Message',
-                'Code', 'Product', 'Qty', 'Cost per Unit',
-                'Total Cost', 'Web_Difference'])
+            errors = []
+            tracker.start_batch(batch_num, num_batches)
+            lookups = {}
+            if lookup_client is not None:
+                with tracker.stage("lookup"):
+                    # The driver may have been recycled, which starts a new session
+                    update_cookies(lookup_client, driver)
+                    lookups = lookup_products(lookup_client, (item.code for item in plan[start_index:end_index]))
+
+            # Positions in the plan, not input indexes, which have gaps after the catalog check
+            for position, item in enumerate(plan[start_index:end_index], start=start_index):
+                row_started = time.perf_counter()
+                errors_before = len(errors)
+                outcome = process_row(driver, item, errors, tracker, lookups.get(item.code))
+                if outcome == "Entered":
+                    submitted[item.code] = item.row_hash
+                if outcome == "Processing Error" and retry_passes:
+                    # Most processing errors are transient; the row is retried after the main pass
+                    del errors[errors_before:]
+                    summary['deferred_rows'].append(position)
+                    tracker.record("Deferred")
+                else:
+                    record_outcome(summary, outcome)
+                    tracker.record(outcome)
+                tracker.render()
+                watchdog.record_row(time.perf_counter() - row_started, outcome)
+                reason = watchdog.recycle_reason()
+                if reason and position + 1 < total_rows:
+                    # The next row continues on the fresh session
+                    driver = recycle_driver(driver, watchdog, reason)
 
-            for index in batch_df.index:
-                data_row_index = start_index + index
-                try:
-                    loop(driver, file, data_row_index, errors_df)
-                    print(f"Processed {data_row_index + 1} out of {total_rows} successfully.")
-                except Exception as e:
-                    error_message = str(e)
-                    traceback_str = traceback.format_exc()
-                    log_error(
-                        errors_df,
-                        row_index=data_row_index,
-                        input_file=file,
-                        error_type="Processing Error",
-                        error_message=error_message,
-                        error_details={'Traceback': traceback_str}
-                    )
-                    continue
+            now = time.perf_counter()
+            summary['duration_seconds'] += now - last_tick
+            last_tick = now
+            # Jobs run in order, so the checkpoint only moves on once the batch's records are on disk;
+            # after any failed write it stays where it is, and the run resumes from there.
+            # The store and summary are copied because this thread keeps changing them.
+            with tracker.stage("save"):
+                writer.submit(save_errors, errors, ERRORS_JOURNAL_PATH, batch_num, raise_errors=True)
+                writer.submit(save_submitted, dict(submitted), SUBMITTED_ROWS_PATH)
+                writer.submit(save_run_summary, copy.deepcopy(summary), RUN_SUMMARY_PATH)
+                # Batches of an incremental run shift as rows are entered, so only the submitted store
+                # records its progress
+                if not incremental:
+                    writer.submit(write_checkpoint, CHECKPOINT_PATH, batch_num + 1,  # Next batch to process
+                                  only_if_clean=True)
+                # Stop before entering more rows than the frozen checkpoint covers, so a resume
+                # only re-enters this batch
+                writer.flush()
+            if writer.failures:
+                raise RuntimeError(f"Saving batch {batch_num + 1} failed; stopping so the run can be "
+                                   f"resumed from this batch.")
+            print(f"\nBatch {batch_num + 1} completed. Errors saved to {ERRORS_JOURNAL_PATH}")
 
-            save_errors(errors_df, output_filepath, batch_num)
-            print(f"Batch {batch_num + 1} completed. Errors saved to {output_filepath}")
-            with open(CHECKPOINT_PATH, 'w', encoding='utf-8') as f:
-                f.write(str(batch_num + 1))  # Next batch to process
+        # Rows deferred by an earlier session get at least one pass even if retries are now off
+        driver = retry_deferred(driver, plan, summary, tracker, watchdog, writer, submitted,
+                                max(retry_passes, 1), retry_fresh_driver, first_batch_num=num_batches)
+        completed = True
     except Exception as e:
         logger.error("An error occurred: %s", str(e), exc_info=True)
     finally:
-        print("End of script.")
+        if status_server:
+            status_server.shutdown()
+        print("\nEnd of script.")
+        # Drain pending writes before the final summary and the report read the journal
+        writer.close()
+        if writer.failures:
+            # The journal or the submitted rows may be missing records, so keep the checkpoint
+            completed = False
+        summary['duration_seconds'] += time.perf_counter() - last_tick
+        summary['last_finished'] = datetime.now().isoformat(timespec='seconds')
+        save_run_summary(summary, RUN_SUMMARY_PATH)
+        # The workbook is written once, after the browser work is done
+        write_report(OUTPUT_XLSX_PATH, input_df, ERRORS_JOURNAL_PATH, summary,
+                     removed_df=removed_rows(summary['removed_codes']))
         save_form(driver)
         # driver.quit()
+    return completed
 
 if __name__ == "__main__":
+    # Kept for existing shortcuts; cli.py is the preferred entry point.
+    setup_logging()
     reset = '--reset' in sys.argv
-    main(unique_df, reset_checkpoint=reset)
-    if os.path.exists(CHECKPOINT_PATH):
+    completed = main(load_input(), reset_checkpoint=reset, incremental='--incremental' in sys.argv,
+                     prune_removed='--prune-removed' in sys.argv)
+    if completed and os.path.exists(CHECKPOINT_PATH):
         os.remove(CHECKPOINT_PATH)
@@ -0,0 +1,84 @@
+# tests/test_lookup.py
+'''Checks helpers.lookup against a local stand-in for the Synergy product search endpoint.
+
+Run from the project folder (config.ini must exist): python -m pytest tests
+'''
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+from config import SEARCH_RESULTS_FIELD, SEARCH_CODE_FIELD, SEARCH_DESCRIPTION_FIELD
+from helpers.lookup import lookup_products, new_lookup_client
+
+CATALOG = {'1001': 'Product One 750Ml', '1002': 'Product Two 2L'}
+
+def _nest(path, value):
+    """Wraps value under a dotted path, the way the backend nests its product list."""
+    for key in reversed(path.split('.')) if path else []:
+        value = {key: value}
+    return value
+
+class StandInHandler(BaseHTTPRequestHandler):
+    '''Answers /search?code=... like the backend, and /broken?code=... with the list under the wrong key.'''
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        code = parse_qs(url.query)['code'][0]
+        if 'sid=session' not in (self.headers.get('Cookie') or ''):
+            self.send_response(302)
+            self.send_header('Location', '/login')
+            self.end_headers()
+            return
+        products = [{SEARCH_CODE_FIELD: code, SEARCH_DESCRIPTION_FIELD: CATALOG[code]}] if code in CATALOG else []
+        payload = _nest(SEARCH_RESULTS_FIELD, products) if url.path == '/search' else {'unexpected': products}
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeDriver:
+    '''Just enough of a logged-in WebDriver for new_lookup_client.'''
+
+    def execute_script(self, script):
+        return 'stand-in'
+
+    def get_cookies(self):
+        return [{'name': 'sid', 'value': 'session'}]
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+def test_found_and_not_found(base_url):
+    client = new_lookup_client(FakeDriver(), workers=4)
+    results = lookup_products(client, ['1001', '1002', '9999', '1001'], workers=4,
+                              url_template=f"{base_url}/search?code={{code}}")
+    assert results['1001'] == [{'Product Code': '1001', 'Product': 'Product One 750Ml'}]
+    assert results['1002'] == [{'Product Code': '1002', 'Product': 'Product Two 2L'}]
+    # An empty product list is a real "not found" answer
+    assert results['9999'] == []
+
+def test_misconfigured_results_field_falls_back(base_url):
+    client = new_lookup_client(FakeDriver(), workers=2)
+    results = lookup_products(client, ['1001', '9999'], workers=2,
+                              url_template=f"{base_url}/broken?code={{code}}")
+    # Codes without a usable answer are left out so the browser searches them instead
+    assert results == {}
+
+def test_expired_session_falls_back(base_url):
+    class LoggedOutDriver(FakeDriver):
+        def get_cookies(self):
+            return []
+    client = new_lookup_client(LoggedOutDriver(), workers=2)
+    results = lookup_products(client, ['1001'], workers=2, url_template=f"{base_url}/search?code={{code}}")
+    assert results == {}
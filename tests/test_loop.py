@@ -0,0 +1,92 @@
+# tests/test_loop.py
+'''Checks the outcome simplified.loop reports when the browser steps fail, with the browser helpers stubbed.
+
+Run from the project folder (config.ini must exist): python -m pytest tests
+'''
+import pytest
+from selenium.common.exceptions import TimeoutException
+import simplified
+from helpers.plan import PlanItem
+from helpers.progress import ProgressTracker
+
+ITEM = PlanItem(0, '1001', 'Product One 750Ml', 2.0, 5.0, 10.0)
+SEARCH_ROWS = [{'Product Code': '1001', 'Product': 'Product One 750Ml'}]
+
+class ClickIntercepted(Exception):
+    '''Stands in for a Selenium error that close_form does not catch.'''
+
+@pytest.fixture
+def browser(monkeypatch):
+    '''Stubs the browser helpers loop calls and records which ones ran.'''
+    calls = []
+    monkeypatch.setattr(simplified, 'NETWORK_CAPTURE', False)
+    monkeypatch.setattr(simplified, 'search_product', lambda driver, code: calls.append('search'))
+    monkeypatch.setattr(simplified, 'extract_all_cells', lambda driver, **kwargs: SEARCH_ROWS)
+    monkeypatch.setattr(simplified, 'wait_for_first_result', lambda driver, code, timeout: calls.append('wait'))
+    def fill_and_read_total(driver, item):
+        calls.append('fill')
+        return item.total_cost
+    monkeypatch.setattr(simplified, 'fill_and_read_total', fill_and_read_total)
+    return calls
+
+def run_row(search_results=None):
+    errors = []
+    outcome = simplified.process_row(None, ITEM, errors, ProgressTracker(1), search_results)
+    return outcome, [error['Error Type'] for error in errors]
+
+def test_entered(browser, monkeypatch):
+    monkeypatch.setattr(simplified, 'close_form', lambda driver: True)
+    assert run_row() == ("Entered", [])
+    assert browser == ['search', 'wait', 'fill']
+
+def test_close_failure_after_fill_is_not_retried(browser, monkeypatch):
+    def close_form(driver):
+        raise ClickIntercepted("Element is not clickable")
+    monkeypatch.setattr(simplified, 'close_form', close_form)
+    assert run_row() == ("Entry Error", ["Entry Error"])
+
+def test_failure_before_fill_is_retried(browser, monkeypatch):
+    def search_product(driver, code):
+        raise ClickIntercepted("Element is not clickable")
+    monkeypatch.setattr(simplified, 'search_product', search_product)
+    monkeypatch.setattr(simplified, 'close_form', lambda driver: True)
+    assert run_row() == ("Processing Error", ["Processing Error"])
+    assert 'fill' not in browser
+
+def test_lookup_waits_for_the_searched_product(browser, monkeypatch):
+    monkeypatch.setattr(simplified, 'close_form', lambda driver: True)
+    assert run_row(search_results=SEARCH_ROWS) == ("Entered", [])
+    assert browser == ['search', 'wait', 'fill']
+
+def test_lookup_not_filled_when_table_shows_another_product(browser, monkeypatch):
+    def wait_for_first_result(driver, code, timeout):
+        raise TimeoutException("The first search result is '2002', not 1001; the line was not filled.")
+    monkeypatch.setattr(simplified, 'wait_for_first_result', wait_for_first_result)
+    monkeypatch.setattr(simplified, 'close_form', lambda driver: True)
+    assert run_row(search_results=SEARCH_ROWS) == ("Processing Error", ["Processing Error"])
+    assert 'fill' not in browser
+
+class ScriptedTable:
+    '''Fake driver whose first search result changes as the table re-renders.'''
+
+    def __init__(self, first_codes):
+        self.first_codes = list(first_codes)
+
+    def execute_script(self, script, *args):
+        return self.first_codes.pop(0) if len(self.first_codes) > 1 else self.first_codes[0]
+
+def test_wait_for_first_result_outlasts_previous_results():
+    from helpers.data_entry_validation import wait_for_first_result
+    wait_for_first_result(ScriptedTable([None, ' 1000 ', '\n1001 ']), '1001', timeout=5)
+
+def test_wait_for_first_result_times_out_on_another_product():
+    from helpers.data_entry_validation import wait_for_first_result
+    with pytest.raises(TimeoutException, match="'1000', not 1001"):
+        wait_for_first_result(ScriptedTable(['1000']), '1001', timeout=0.3)
+
+def test_network_capture_waits_for_the_table_before_filling(browser, monkeypatch):
+    monkeypatch.setattr(simplified, 'NETWORK_CAPTURE', True)
+    monkeypatch.setattr(simplified, 'capture_search', lambda driver, code, timeout: browser.append('capture') or SEARCH_ROWS)
+    monkeypatch.setattr(simplified, 'close_form', lambda driver: True)
+    assert run_row() == ("Entered", [])
+    assert browser == ['capture', 'wait', 'fill']
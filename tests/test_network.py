@@ -0,0 +1,98 @@
+# tests/test_network.py
+'''Checks helpers.network.capture_search against scripted DevTools performance log entries.
+
+Run from the project folder (config.ini must exist): python -m pytest tests
+'''
+import json
+import pytest
+from selenium.common.exceptions import TimeoutException
+import helpers.network
+from config import SEARCH_RESULTS_FIELD, SEARCH_CODE_FIELD, SEARCH_DESCRIPTION_FIELD
+from helpers.network import capture_search
+
+SEARCH_URL = 'https://synergy.example/api/ProductSearch'
+
+def _nest(path, value):
+    """Wraps value under a dotted path, the way the backend nests its product list."""
+    for key in reversed(path.split('.')) if path else []:
+        value = {key: value}
+    return value
+
+def _products(*rows):
+    return _nest(SEARCH_RESULTS_FIELD, [{SEARCH_CODE_FIELD: code, SEARCH_DESCRIPTION_FIELD: description}
+                                        for code, description in rows])
+
+def _event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+def sent(request_id, url):
+    return _event('Network.requestWillBeSent', requestId=request_id, request={'url': url})
+
+def finished(request_id):
+    return _event('Network.loadingFinished', requestId=request_id)
+
+def failed(request_id):
+    return _event('Network.loadingFailed', requestId=request_id)
+
+class ScriptedDriver:
+    '''Returns one batch of log entries per get_log call, and the given body per request.'''
+
+    def __init__(self, batches, bodies):
+        # The first call only empties the log before the search is typed
+        self.batches = [[]] + list(batches)
+        self.bodies = bodies
+
+    def get_log(self, kind):
+        return self.batches.pop(0) if self.batches else []
+
+    def execute_cdp_cmd(self, command, params):
+        return {'body': json.dumps(self.bodies[params['requestId']])}
+
+@pytest.fixture(autouse=True)
+def typed(monkeypatch):
+    monkeypatch.setattr(helpers.network, 'search_product', lambda driver, code: None)
+    monkeypatch.setattr(helpers.network, 'SEARCH_URL_PATTERN', 'ProductSearch')
+
+def test_prefix_responses_are_ignored_until_the_full_code_lands():
+    bodies = {
+        '1': _products(('1001', 'Prefix match'), ('1002', 'Other')),
+        '2': _products(('1001', 'Product One 750Ml'), ('1002', 'Other')),
+        '3': _products(('1001', 'Product One 750Ml')),
+    }
+    driver = ScriptedDriver([
+        # The prefix response already lists the code while the full-code request is in flight
+        [sent('1', f'{SEARCH_URL}?text=10'), sent('2', f'{SEARCH_URL}?text=100'),
+         sent('3', f'{SEARCH_URL}?text=1001'), finished('1')],
+        [failed('2')],
+        [],
+        [finished('3')],
+    ], bodies)
+    assert capture_search(driver, '1001', timeout=5) == [{'Product Code': '1001', 'Product': 'Product One 750Ml'}]
+
+def test_longer_code_in_the_url_is_not_the_full_code():
+    bodies = {'1': _products(('10010', 'Longer code'))}
+    driver = ScriptedDriver([[sent('1', f'{SEARCH_URL}?text=10010'), finished('1')]], bodies)
+    # Taken only through the settle path, since the URL carries another code
+    assert capture_search(driver, '1001', timeout=5, settle=0.2) == [{'Product Code': '10010', 'Product': 'Longer code'}]
+
+def test_post_search_without_the_code_in_the_url_settles_on_the_latest_response():
+    bodies = {
+        '1': _products(('1001', 'Prefix match'), ('1002', 'Other')),
+        '2': _products(('1001', 'Product One 750Ml')),
+    }
+    driver = ScriptedDriver([
+        [sent('1', SEARCH_URL), finished('1'), sent('2', SEARCH_URL)],
+        [],
+        [finished('2')],
+    ], bodies)
+    assert capture_search(driver, '1001', timeout=5, settle=0.2) == [{'Product Code': '1001', 'Product': 'Product One 750Ml'}]
+
+def test_unrelated_requests_are_ignored():
+    driver = ScriptedDriver([[sent('1', 'https://synergy.example/api/Session'), finished('1')]], {})
+    with pytest.raises(TimeoutException):
+        capture_search(driver, '1001', timeout=0.3)
+
+def test_response_without_a_product_list_raises():
+    driver = ScriptedDriver([[sent('1', f'{SEARCH_URL}?text=1001'), finished('1')]], {'1': {'unexpected': []}})
+    with pytest.raises(ValueError, match='no product list'):
+        capture_search(driver, '1001', timeout=5)